@@ -13,33 +13,57 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from data_fetcher import DataFetcher
+from typing import Dict, List, Optional, Tuple
+from data_fetcher import get_default_fetcher
 from strategies import get_strategy, list_strategies, DEFAULT_STRATEGY
-import json
+import orjson
 import os
 
 
-def analyze_for_tomorrow(symbols: List[str], strategy_name: str = DEFAULT_STRATEGY) -> Dict:
+def _build_stock_info(symbol: str, latest: Dict) -> Dict:
+    """Build the trading plan entry for a symbol's latest indicator values"""
+    current_price = float(latest['close'])
+    
+    # Calculate recommended entry/exit levels
+    stop_loss = current_price * 0.95  # 5% stop loss
+    take_profit = current_price * 1.10  # 10% take profit
+    
+    return {
+        'symbol': symbol,
+        'current_price': round(current_price, 2),
+        'rsi': round(float(latest['rsi']), 2),
+        'fast_ma': round(float(latest['fast_ma']), 2),
+        'slow_ma': round(float(latest['slow_ma']), 2),
+        'signal_strength': 0,
+        'stop_loss': round(stop_loss, 2),
+        'take_profit': round(take_profit, 2),
+    }
+
+
+def analyze_for_tomorrow(symbols: List[str], strategy_name: str = DEFAULT_STRATEGY,
+                         max_workers: int = 10) -> Dict:
     """
     Analyze stocks for tomorrow's trading session.
     
     Args:
         symbols: List of stock tickers to analyze
         strategy_name: Strategy to use for analysis
+        max_workers: Maximum number of concurrent downloads
         
     Returns:
         Dictionary with analysis results and trading plan
     """
     strategy = get_strategy(strategy_name)
-    data_fetcher = DataFetcher(source='yfinance')
+    data_fetcher = get_default_fetcher(downcast=True)
     
+    now = datetime.now()
     trading_plan = {
-        'generated_at': datetime.now().isoformat(),
+        'generated_at': now.isoformat(),
         'strategy': strategy_name,
-        'market_date': (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
+        'market_date': (now + timedelta(days=1)).strftime('%Y-%m-%d'),
         'buy_candidates': [],
         'sell_candidates': [],
         'watch_list': [],
@@ -50,67 +74,63 @@ def analyze_for_tomorrow(symbols: List[str], strategy_name: str = DEFAULT_STRATE
     print(f"Strategy: {strategy_name.upper()}")
     print()
     
+    # Fetch recent data (30 days - good for indicators) for all symbols in one batch
+    data = data_fetcher.fetch_batch(symbols, period=30, max_workers=max_workers)
+    
+    # Analyze, score and categorize every symbol's latest bar in vectorized passes
+    latest_df = strategy.analyze_batch(data)
+    latest_rows = latest_df.to_dict('index')
+    scores = dict(zip(latest_df.index, zip(*score_signals(latest_df))))
+    
+    # Collect the per-symbol status lines and write them out in one go
+    lines = []
     for symbol in symbols:
+        if symbol not in latest_rows:
+            reason = "No data found" if symbol not in data else "Missing price data"
+            lines.append(f"✗ {symbol:<6} - Error: {reason} for symbol: {symbol}")
+            continue
+        
+        latest = latest_rows[symbol]
         try:
-            # Fetch recent data (30 days - good for indicators, works with data source)
-            df = data_fetcher.fetch_data(symbol, period=30)
-            
-            # Analyze with strategy
-            analyzed_df = strategy.analyze(df)
-            latest = analyzed_df.iloc[-1]
-            
-            # Get current signal
             signal = int(latest['signal'])
-            current_price = float(latest['close'])
-            rsi = float(latest['rsi'])
+            stock_info = _build_stock_info(symbol, latest)
+        except Exception as e:
+            lines.append(f"✗ {symbol:<6} - Error: {str(e)[:50]}")
+            continue
+        
+        rsi = stock_info['rsi']
+        current_price = stock_info['current_price']
+        signal_strength, category = scores[symbol]
+        
+        # Categorize based on signal
+        if signal == 1:
+            # Buy signal
+            stock_info['signal_strength'] = round(float(signal_strength), 2)
+            stock_info['recommendation'] = 'BUY'
+            stock_info['reason'] = get_buy_reason(latest)
+            trading_plan['buy_candidates'].append(stock_info)
+            lines.append(f"✓ {symbol:<6} - BUY signal  (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
             
-            # Calculate recommended entry/exit levels
-            stop_loss = current_price * 0.95  # 5% stop loss
-            take_profit = current_price * 1.10  # 10% take profit
+        elif signal == -1:
+            # Sell signal
+            stock_info['signal_strength'] = round(float(signal_strength), 2)
+            stock_info['recommendation'] = 'SELL'
+            stock_info['reason'] = get_sell_reason(latest)
+            trading_plan['sell_candidates'].append(stock_info)
+            lines.append(f"✓ {symbol:<6} - SELL signal (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
             
-            stock_info = {
-                'symbol': symbol,
-                'current_price': round(current_price, 2),
-                'rsi': round(rsi, 2),
-                'fast_ma': round(float(latest['fast_ma']), 2),
-                'slow_ma': round(float(latest['slow_ma']), 2),
-                'signal_strength': 0,
-                'stop_loss': round(stop_loss, 2),
-                'take_profit': round(take_profit, 2),
-            }
+        elif category == 'watch':
+            # Watch list - stocks close to signal thresholds
+            stock_info['recommendation'] = 'WATCH'
+            stock_info['reason'] = get_watch_reason(latest)
+            trading_plan['watch_list'].append(stock_info)
+            lines.append(f"✓ {symbol:<6} - WATCH      (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
             
-            # Categorize based on signal
-            if signal == 1:
-                # Buy signal
-                signal_strength = calculate_signal_strength(latest, 'buy')
-                stock_info['signal_strength'] = round(signal_strength, 2)
-                stock_info['recommendation'] = 'BUY'
-                stock_info['reason'] = get_buy_reason(latest)
-                trading_plan['buy_candidates'].append(stock_info)
-                print(f"✓ {symbol:<6} - BUY signal  (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
-                
-            elif signal == -1:
-                # Sell signal
-                signal_strength = calculate_signal_strength(latest, 'sell')
-                stock_info['signal_strength'] = round(signal_strength, 2)
-                stock_info['recommendation'] = 'SELL'
-                stock_info['reason'] = get_sell_reason(latest)
-                trading_plan['sell_candidates'].append(stock_info)
-                print(f"✓ {symbol:<6} - SELL signal (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
-                
-            else:
-                # Watch list - stocks close to signal thresholds
-                if is_worth_watching(latest):
-                    stock_info['recommendation'] = 'WATCH'
-                    stock_info['reason'] = get_watch_reason(latest)
-                    trading_plan['watch_list'].append(stock_info)
-                    print(f"✓ {symbol:<6} - WATCH      (RSI: {rsi:.1f}, Price: ${current_price:.2f})")
-                else:
-                    print(f"○ {symbol:<6} - No signal")
-                    
-        except Exception as e:
-            print(f"✗ {symbol:<6} - Error: {str(e)[:50]}")
-            continue
+        else:
+            lines.append(f"○ {symbol:<6} - No signal")
+    
+    if lines:
+        print("\n".join(lines))
     
     # Sort by signal strength
     trading_plan['buy_candidates'].sort(key=lambda x: x['signal_strength'], reverse=True)
@@ -127,22 +147,29 @@ def analyze_for_tomorrow(symbols: List[str], strategy_name: str = DEFAULT_STRATE
     return trading_plan
 
 
-def calculate_signal_strength(row: pd.Series, signal_type: str) -> float:
-    """Calculate strength of a trading signal (0-100)"""
-    if signal_type == 'buy':
-        # Factors: RSI recovery, MA alignment, price momentum
-        rsi_factor = min((50 - row['rsi']) / 20, 1.0) if row['rsi'] < 50 else 0.5
-        ma_factor = (row['fast_ma'] - row['slow_ma']) / row['slow_ma'] * 10
-        price_factor = (row['close'] - row['slow_ma']) / row['slow_ma'] * 5
-        return max(0, min(100, (rsi_factor + ma_factor + price_factor) * 20))
-    else:  # sell
-        # Factors: RSI overbought, bearish MA alignment
-        rsi_factor = (row['rsi'] - 50) / 30 if row['rsi'] > 50 else 0
-        ma_factor = 1.0 if row['fast_ma'] < row['slow_ma'] else 0.5
-        return max(0, min(100, (rsi_factor + ma_factor) * 40))
+def calculate_signal_strength(rows: pd.DataFrame, signal_type: str) -> np.ndarray:
+    """Calculate strength of a trading signal (0-100) for each row at once"""
+    rsi = rows['rsi'].to_numpy(dtype=float)
+    fast_ma = rows['fast_ma'].to_numpy(dtype=float)
+    slow_ma = rows['slow_ma'].to_numpy(dtype=float)
+    
+    # fmin/fmax skip NaN, so missing MAs saturate at 100 like builtin min/max
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if signal_type == 'buy':
+            # Factors: RSI recovery, MA alignment, price momentum
+            close = rows['close'].to_numpy(dtype=float)
+            rsi_factor = np.where(rsi < 50, np.minimum((50 - rsi) / 20, 1.0), 0.5)
+            ma_factor = (fast_ma - slow_ma) / slow_ma * 10
+            price_factor = (close - slow_ma) / slow_ma * 5
+            return np.fmax(0, np.fmin(100, (rsi_factor + ma_factor + price_factor) * 20))
+        else:  # sell
+            # Factors: RSI overbought, bearish MA alignment
+            rsi_factor = np.where(rsi > 50, (rsi - 50) / 30, 0)
+            ma_factor = np.where(fast_ma < slow_ma, 1.0, 0.5)
+            return np.fmax(0, np.fmin(100, (rsi_factor + ma_factor) * 40))
 
 
-def get_buy_reason(row: pd.Series) -> str:
+def get_buy_reason(row: Dict) -> str:
     """Generate human-readable reason for buy signal"""
     reasons = []
     
@@ -156,7 +183,7 @@ def get_buy_reason(row: pd.Series) -> str:
     return ", ".join(reasons) if reasons else "Multiple bullish indicators"
 
 
-def get_sell_reason(row: pd.Series) -> str:
+def get_sell_reason(row: Dict) -> str:
     """Generate human-readable reason for sell signal"""
     reasons = []
     
@@ -168,7 +195,7 @@ def get_sell_reason(row: pd.Series) -> str:
     return ", ".join(reasons) if reasons else "Multiple bearish indicators"
 
 
-def get_watch_reason(row: pd.Series) -> str:
+def get_watch_reason(row: Dict) -> str:
     """Generate reason for watch list"""
     if 35 < row['rsi'] < 45:
         return "RSI approaching oversold - potential buy setup"
@@ -180,17 +207,45 @@ def get_watch_reason(row: pd.Series) -> str:
         return "Monitor for signal development"
 
 
-def is_worth_watching(row: pd.Series) -> bool:
-    """Determine if stock should be on watch list"""
+def is_worth_watching(rows: pd.DataFrame) -> np.ndarray:
+    """Determine which stocks should be on the watch list"""
     # Add to watch list if:
     # 1. RSI approaching key levels
     # 2. MAs about to cross
     # 3. Other interesting setups
+    rsi = rows['rsi'].to_numpy(dtype=float)
+    fast_ma = rows['fast_ma'].to_numpy(dtype=float)
+    slow_ma = rows['slow_ma'].to_numpy(dtype=float)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rsi_interesting = ((35 < rsi) & (rsi < 45)) | ((60 < rsi) & (rsi < 70))
+        ma_converging = np.abs(fast_ma - slow_ma) / slow_ma < 0.01
+    
+    return rsi_interesting | ma_converging
+
+
+def score_signals(rows: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score and categorize a batch of latest indicator rows.
     
-    rsi_interesting = (35 < row['rsi'] < 45) or (60 < row['rsi'] < 70)
-    ma_converging = abs(row['fast_ma'] - row['slow_ma']) / row['slow_ma'] < 0.01
+    Args:
+        rows: DataFrame with one row of latest indicator values per stock
+        
+    Returns:
+        Tuple of (signal strength, category) arrays, where category is
+        'buy', 'sell', 'watch' or '' for no signal
+    """
+    signal = rows['signal'].to_numpy(dtype=float)
+    is_buy = signal == 1
+    is_sell = signal == -1
     
-    return rsi_interesting or ma_converging
+    strength = np.select(
+        [is_buy, is_sell],
+        [calculate_signal_strength(rows, 'buy'), calculate_signal_strength(rows, 'sell')],
+        0.0
+    )
+    category = np.select([is_buy, is_sell, is_worth_watching(rows)], ['buy', 'sell', 'watch'], '')
+    return strength, category
 
 
 def save_trading_plan(plan: Dict, filename: Optional[str] = None) -> str:
@@ -203,64 +258,74 @@ def save_trading_plan(plan: Dict, filename: Optional[str] = None) -> str:
     os.makedirs('trading_plans', exist_ok=True)
     filepath = os.path.join('trading_plans', filename)
     
-    with open(filepath, 'w') as f:
-        json.dump(plan, f, indent=2, default=str)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(
+            plan,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        ))
     
     return filepath
 
 
 def print_trading_plan(plan: Dict):
     """Pretty print the trading plan"""
-    print("\n" + "=" * 70)
-    print("📋 TRADING PLAN FOR NEXT SESSION")
-    print("=" * 70)
-    print(f"Generated: {plan['generated_at']}")
-    print(f"Market Date: {plan['market_date']}")
-    print(f"Strategy: {plan['strategy'].upper()}")
-    print()
+    # Build the whole report first and write it out once
+    lines = []
+    # Symbol and price columns shared by every section
+    price_row = "{:<6} ${:>8.2f}".format
+    lines.append("\n" + "=" * 70)
+    lines.append("📋 TRADING PLAN FOR NEXT SESSION")
+    lines.append("=" * 70)
+    lines.append(f"Generated: {plan['generated_at']}")
+    lines.append(f"Market Date: {plan['market_date']}")
+    lines.append(f"Strategy: {plan['strategy'].upper()}")
+    lines.append("")
     
     # Buy candidates
     if plan['buy_candidates']:
-        print("=" * 70)
-        print(f"🎯 BUY CANDIDATES ({len(plan['buy_candidates'])})")
-        print("=" * 70)
+        lines.append("=" * 70)
+        lines.append(f"🎯 BUY CANDIDATES ({len(plan['buy_candidates'])})")
+        lines.append("=" * 70)
         for stock in plan['buy_candidates'][:10]:  # Top 10
-            print(f"\n{stock['symbol']:<6} ${stock['current_price']:>8.2f}  "
-                  f"Strength: {stock['signal_strength']:>5.1f}/100")
-            print(f"       RSI: {stock['rsi']:.1f}  |  "
-                  f"Stop: ${stock['stop_loss']:.2f}  |  "
-                  f"Target: ${stock['take_profit']:.2f}")
-            print(f"       {stock['reason']}")
+            lines.append(f"\n{price_row(stock['symbol'], stock['current_price'])}  "
+                         f"Strength: {stock['signal_strength']:>5.1f}/100")
+            lines.append(f"       RSI: {stock['rsi']:.1f}  |  "
+                         f"Stop: ${stock['stop_loss']:.2f}  |  "
+                         f"Target: ${stock['take_profit']:.2f}")
+            lines.append(f"       {stock['reason']}")
     
     # Sell candidates
     if plan['sell_candidates']:
-        print("\n" + "=" * 70)
-        print(f"📉 SELL CANDIDATES ({len(plan['sell_candidates'])})")
-        print("=" * 70)
+        lines.append("\n" + "=" * 70)
+        lines.append(f"📉 SELL CANDIDATES ({len(plan['sell_candidates'])})")
+        lines.append("=" * 70)
         for stock in plan['sell_candidates'][:10]:
-            print(f"\n{stock['symbol']:<6} ${stock['current_price']:>8.2f}  "
-                  f"Strength: {stock['signal_strength']:>5.1f}/100")
-            print(f"       RSI: {stock['rsi']:.1f}")
-            print(f"       {stock['reason']}")
+            lines.append(f"\n{price_row(stock['symbol'], stock['current_price'])}  "
+                         f"Strength: {stock['signal_strength']:>5.1f}/100")
+            lines.append(f"       RSI: {stock['rsi']:.1f}")
+            lines.append(f"       {stock['reason']}")
     
     # Watch list
     if plan['watch_list']:
-        print("\n" + "=" * 70)
-        print(f"👁️  WATCH LIST ({len(plan['watch_list'])})")
-        print("=" * 70)
+        lines.append("\n" + "=" * 70)
+        lines.append(f"👁️  WATCH LIST ({len(plan['watch_list'])})")
+        lines.append("=" * 70)
         for stock in plan['watch_list'][:5]:
-            print(f"  {stock['symbol']:<6} ${stock['current_price']:>8.2f}  "
-                  f"RSI: {stock['rsi']:.1f}  -  {stock['reason']}")
+            lines.append(f"  {price_row(stock['symbol'], stock['current_price'])}  "
+                         f"RSI: {stock['rsi']:.1f}  -  {stock['reason']}")
     
     # Summary
-    print("\n" + "=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
-    print(f"Total Analyzed:  {plan['summary']['total_analyzed']}")
-    print(f"Buy Signals:     {plan['summary']['buy_signals']}")
-    print(f"Sell Signals:    {plan['summary']['sell_signals']}")
-    print(f"Watch List:      {plan['summary']['watch_list']}")
-    print()
+    lines.append("\n" + "=" * 70)
+    lines.append("SUMMARY")
+    lines.append("=" * 70)
+    lines.append(f"Total Analyzed:  {plan['summary']['total_analyzed']}")
+    lines.append(f"Buy Signals:     {plan['summary']['buy_signals']}")
+    lines.append(f"Sell Signals:    {plan['summary']['sell_signals']}")
+    lines.append(f"Watch List:      {plan['summary']['watch_list']}")
+    lines.append("")
+    
+    print("\n".join(lines))
 
 
 if __name__ == '__main__':
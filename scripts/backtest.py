@@ -7,13 +7,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
-import json
-from datetime import datetime
+import orjson
+import time
 from backtester import Backtester
 from strategies import list_strategies, DEFAULT_STRATEGY
 from config import Config
 
 
+RESULTS_DIR = Path('backtest_results')
+RESULTS_DIR.mkdir(exist_ok=True)
+
+
 def run_backtest(symbol: str, initial_capital: float = 10000, 
                 start_date: str = None, end_date: str = None,
                 strategy_name: str = DEFAULT_STRATEGY):
@@ -60,27 +64,25 @@ def run_backtest(symbol: str, initial_capital: float = 10000,
             print("RECENT TRADES")
             print("=" * 60)
             trades = results['trades'][-10:]  # Show last 10 trades
-            for i, trade in enumerate(trades, 1):
-                print(f"\nTrade {i}:")
-                print(f"  Entry:  {trade['entry_time']} @ ${trade['entry_price']:.2f}")
-                print(f"  Exit:   {trade['exit_time']} @ ${trade['exit_price']:.2f}")
-                print(f"  Shares: {trade['shares']}")
-                print(f"  P&L:    ${trade['pnl']:.2f} ({trade['return_pct']:.2f}%)")
-                print(f"  Reason: {trade['exit_reason']}")
+            print("\n".join(
+                f"\nTrade {i}:\n"
+                f"  Entry:  {trade['entry_time']} @ ${trade['entry_price']:.2f}\n"
+                f"  Exit:   {trade['exit_time']} @ ${trade['exit_price']:.2f}\n"
+                f"  Shares: {trade['shares']}\n"
+                f"  P&L:    ${trade['pnl']:.2f} ({trade['return_pct']:.2f}%)\n"
+                f"  Reason: {trade['exit_reason']}"
+                for i, trade in enumerate(trades, 1)
+            ))
         
         # Save results to file
-        output_file = f"backtest_results/{symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        import os
-        os.makedirs('backtest_results', exist_ok=True)
-        with open(output_file, 'w') as f:
-            # Convert datetime objects to strings for JSON serialization
-            results_copy = results.copy()
-            results_copy['trades'] = [
-                {k: str(v) if isinstance(v, datetime) else v 
-                 for k, v in trade.items()} 
-                for trade in results_copy['trades']
-            ]
-            json.dump(results_copy, f, indent=2, default=str)
+        output_file = RESULTS_DIR / f"{symbol}_{time.time_ns()}.json"
+        with open(output_file, 'wb') as f:
+            # orjson encodes numpy scalars natively; timestamps fall back to str()
+            f.write(orjson.dumps(
+                results,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+            ))
         
         print(f"\nResults saved to: {output_file}")
         
@@ -7,14 +7,60 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
+import heapq
+import logging
+import numpy as np
 import pandas as pd
-from strategies import get_strategy, DEFAULT_STRATEGY
-from data_fetcher import DataFetcher
+from typing import Optional
+from strategies import get_strategy, DEFAULT_STRATEGY, LATEST_COLUMNS
+from data_fetcher import get_default_fetcher
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+def _signal_strength(signal: np.ndarray, rsi: np.ndarray, fast_ma: np.ndarray,
+                     slow_ma: np.ndarray) -> np.ndarray:
+    """
+    Score signal strength (0-100) for all symbols at once.
+    
+    Buy and sell signals are scored on RSI and MA alignment; holds get a
+    "potential" score for how close they are to generating a signal.
+    """
+    # fmin/fmax skip NaN, so a warm-up NaN moving average saturates at 100
+    # like builtin min/max did, where np.clip would propagate the NaN
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ma_ratio = (fast_ma - slow_ma) / slow_ma
+        
+        # Buy signal strength based on RSI and MA alignment
+        buy_rsi_score = np.where(rsi < 50, np.maximum(0, (50 - rsi) / 20), 0.3)
+        buy_strength = np.fmax(0, np.fmin(100, buy_rsi_score + ma_ratio * 100))
+        
+        # Sell signal strength
+        sell_rsi_score = np.where(rsi > 50, (rsi - 50) / 30, 0)
+        sell_strength = np.fmax(0, np.fmin(100, sell_rsi_score * 80))
+        
+        # Hold: near oversold / overbought, or MAs within 2% of each other
+        rsi_proximity = np.select(
+            [(rsi > 35) & (rsi < 45), (rsi > 60) & (rsi < 70)],
+            [(45 - rsi) / 10 * 50, (rsi - 60) / 10 * 50],
+            0
+        )
+        ma_diff_pct = np.abs(ma_ratio) * 100
+        ma_proximity = np.where(
+            (fast_ma > 0) & (slow_ma > 0) & (ma_diff_pct < 2),
+            (2 - ma_diff_pct) / 2 * 50,
+            0
+        )
+        hold_strength = np.maximum(rsi_proximity, ma_proximity)
+    
+    return np.select([signal == 1, signal == -1], [buy_strength, sell_strength], hold_strength)
+
+
 def identify_potential_stocks(symbols: list, min_volume: int = 1000000, 
-                             strategy_name: str = 'balanced') -> pd.DataFrame:
+                             strategy_name: str = 'balanced',
+                             top_n: Optional[int] = None) -> pd.DataFrame:
     """
     Analyze multiple stocks and identify potential trading opportunities.
     
@@ -22,90 +68,76 @@ def identify_potential_stocks(symbols: list, min_volume: int = 1000000,
         symbols: List of stock tickers to analyze
         min_volume: Minimum daily volume threshold
         strategy_name: Strategy to use (conservative, balanced, aggressive)
+        top_n: Only return the N best-ranked stocks (defaults to all)
         
     Returns:
         DataFrame with analysis results sorted by signal strength
     """
     strategy = get_strategy(strategy_name)
-    data_fetcher = DataFetcher(source='yfinance')
-    results = []
+    data_fetcher = get_default_fetcher(downcast=True)
     
     print(f"Analyzing {len(symbols)} stocks...")
     
+    # Fetch all symbols in one batched request instead of one round-trip each
+    data = data_fetcher.fetch_batch(symbols, period=30)
+    
     for symbol in symbols:
-        try:
-            # Fetch data
-            df = data_fetcher.fetch_data(symbol, period=30)
-            
-            # Check volume (but still include in results even if low)
-            avg_volume = df['volume'].tail(20).mean()
-            low_volume = avg_volume < min_volume
-            
-            # Analyze
-            analyzed_df = strategy.analyze(df)
-            latest = analyzed_df.iloc[-1]
-            
-            # Calculate signal strength (for all stocks, not just buy signals)
-            signal_strength = 0
-            
-            if latest['signal'] == 1:
-                # Buy signal strength based on RSI and MA alignment
-                rsi_score = max(0, (50 - latest['rsi']) / 20) if latest['rsi'] < 50 else 0.3
-                ma_score = (latest['fast_ma'] - latest['slow_ma']) / latest['slow_ma']
-                signal_strength = max(0, min(100, (rsi_score + ma_score * 100)))
-            elif latest['signal'] == -1:
-                # Sell signal strength
-                rsi_score = (latest['rsi'] - 50) / 30 if latest['rsi'] > 50 else 0
-                signal_strength = max(0, min(100, rsi_score * 80))
-            else:
-                # For hold, calculate "potential" score
-                # How close is it to generating a signal?
-                rsi_proximity = 0
-                if 35 < latest['rsi'] < 45:  # Near oversold
-                    rsi_proximity = (45 - latest['rsi']) / 10 * 50
-                elif 60 < latest['rsi'] < 70:  # Near overbought
-                    rsi_proximity = (latest['rsi'] - 60) / 10 * 50
-                
-                ma_proximity = 0
-                if latest['fast_ma'] > 0 and latest['slow_ma'] > 0:
-                    ma_diff_pct = abs((latest['fast_ma'] - latest['slow_ma']) / latest['slow_ma']) * 100
-                    if ma_diff_pct < 2:  # MAs within 2% of each other
-                        ma_proximity = (2 - ma_diff_pct) / 2 * 50
-                
-                signal_strength = max(rsi_proximity, ma_proximity)
-            
-            # Determine status
-            status = 'buy' if latest['signal'] == 1 else 'sell' if latest['signal'] == -1 else 'hold'
-            
-            # Add watch indicator for stocks close to signals
-            watch_indicator = ''
-            if status == 'hold' and signal_strength > 30:
-                watch_indicator = ' 👁️'
-            
-            results.append({
-                'symbol': symbol,
-                'signal': status + watch_indicator,
-                'signal_value': latest['signal'],
-                'signal_strength': round(signal_strength, 1),
-                'price': round(latest['close'], 2),
-                'rsi': round(latest['rsi'], 1),
-                'fast_ma': round(latest['fast_ma'], 2),
-                'slow_ma': round(latest['slow_ma'], 2),
-                'volume': int(avg_volume),
-                'ma_crossover': latest['fast_ma'] > latest['slow_ma'],
-                'low_volume': low_volume
-            })
-            
-            print(f"✓ Analyzed {symbol}")
-            
-        except Exception as e:
-            print(f"✗ Failed to analyze {symbol}: {e}")
-            continue
-    
-    # Create DataFrame and sort by signal strength
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        # Sort: buy signals first (by strength), then sell, then hold
+        if symbol not in data:
+            print(f"✗ Failed to analyze {symbol}: No data found for symbol: {symbol}")
+    
+    # Analyze every symbol's latest bar in one batched pass; the frames are
+    # small, so the indicator math costs less than farming it out to workers
+    latest = strategy.analyze_batch(data)
+    
+    for symbol in data:
+        if symbol in latest.index:
+            logger.debug(f"✓ Analyzed {symbol}")
+        else:
+            print(f"✗ Failed to analyze {symbol}: Missing price data")
+    
+    if latest.empty:
+        return pd.DataFrame()
+    
+    symbol_col = latest.index.to_numpy(dtype=object)
+    signal, price, rsi, fast_ma, slow_ma = (latest[col].to_numpy() for col in LATEST_COLUMNS)
+    
+    # Check volume (but still include in results even if low); NaN bars are skipped
+    avg_volume = np.array([data[symbol]['volume'].tail(20).mean() for symbol in symbol_col])
+    avg_volume = np.nan_to_num(avg_volume)
+    volume = avg_volume.astype(np.int64)
+    low_volume = avg_volume < min_volume
+    
+    # Score every symbol in one vectorized pass
+    signal_strength = _signal_strength(signal, rsi, fast_ma, slow_ma)
+    
+    # Add watch indicator for holds close to signals
+    status = np.select([signal == 1, signal == -1], ['buy', 'sell'], 'hold')
+    watch = (status == 'hold') & (signal_strength > 30)
+    
+    results_df = pd.DataFrame({
+        'symbol': symbol_col,
+        'signal': np.where(watch, np.char.add(status, ' 👁️'), status),
+        'category': status,
+        'watch': watch,
+        'signal_value': signal,
+        'signal_strength': np.round(signal_strength, 1),
+        'price': np.round(price, 2),
+        'rsi': np.round(rsi, 1),
+        'fast_ma': np.round(fast_ma, 2),
+        'slow_ma': np.round(slow_ma, 2),
+        'volume': volume,
+        'ma_crossover': fast_ma > slow_ma,
+        'low_volume': low_volume
+    })
+    
+    # Sort: buy signals first (by strength), then sell, then hold
+    if top_n is not None:
+        # Partial selection is O(N log K) versus a full sort of every symbol
+        keys = zip(results_df['signal_value'], results_df['signal_strength'],
+                   range(0, -len(results_df), -1))
+        top = heapq.nlargest(top_n, keys)
+        results_df = results_df.iloc[[-position for _, _, position in top]]
+    else:
         results_df = results_df.sort_values(
             by=['signal_value', 'signal_strength'], 
             ascending=[False, False]
@@ -115,6 +147,10 @@ def identify_potential_stocks(symbols: list, min_volume: int = 1000000,
 
 
 if __name__ == '__main__':
+    # Per-symbol progress is only shown with -v
+    logging.basicConfig(format='%(message)s')
+    logger.setLevel(logging.DEBUG if '-v' in sys.argv else logging.INFO)
+    
     # Expanded stock universe for better opportunity discovery
     symbols = [
         # Mega Cap Tech
@@ -155,24 +191,24 @@ if __name__ == '__main__':
         print(results[display_cols].to_string(index=False))
         
         # Highlight buy signals
-        buy_signals = results[results['signal'].str.contains('buy', na=False)]
+        buy_signals = results[results['category'] == 'buy']
         if not buy_signals.empty:
             print("\n" + "=" * 60)
             print(f"🎯 BUY SIGNALS DETECTED ({len(buy_signals)} stocks)")
             print("=" * 60)
-            for _, stock in buy_signals.head(10).iterrows():
+            for stock in buy_signals.head(10).to_dict('records'):
                 print(f"  {stock['symbol']:<6} ${stock['price']:>8.2f}  "
                       f"RSI: {stock['rsi']:>5.1f}  "
                       f"Strength: {stock['signal_strength']:>5.1f}")
         
         # Highlight watch list (high potential holds)
-        watch_list = results[results['signal'].str.contains('👁️', na=False)]
+        watch_list = results[results['watch']]
         if not watch_list.empty:
             print("\n" + "=" * 60)
             print(f"👁️  WATCH LIST ({len(watch_list)} stocks)")
             print("=" * 60)
             print("These stocks are close to generating signals:")
-            for _, stock in watch_list.head(10).iterrows():
+            for stock in watch_list.head(10).to_dict('records'):
                 reason = ""
                 if 35 < stock['rsi'] < 45:
                     reason = "RSI approaching oversold"
@@ -184,10 +220,11 @@ if __name__ == '__main__':
                       f"RSI: {stock['rsi']:>5.1f}  -  {reason}")
         
         # Show summary
-        buy_count = len(results[results['signal'].str.contains('buy', na=False)])
-        sell_count = len(results[results['signal'].str.contains('sell', na=False)])
-        watch_count = len(results[results['signal'].str.contains('👁️', na=False)])
-        hold_count = len(results[results['signal'].str.contains('hold', na=False)]) - watch_count
+        category_counts = results['category'].value_counts()
+        buy_count = category_counts.get('buy', 0)
+        sell_count = category_counts.get('sell', 0)
+        watch_count = len(watch_list)
+        hold_count = category_counts.get('hold', 0) - watch_count
         
         print("\n" + "=" * 60)
         print("SUMMARY")
@@ -38,18 +38,18 @@ def run_live_trading(symbol: str, dry_run: bool = True, interval: int = 300):
     print("Press Ctrl+C to stop\n")
     
     try:
+        # Schedule ticks on a fixed monotonic grid so work time doesn't add drift
+        next_tick = time.monotonic()
         while True:
-            # Get status
-            status = trader.get_status()
+            # Analyze once, then check and execute on the same signal
+            status = trader.step(dry_run=dry_run)
+            result = status['result']
             
             print(f"\n[{status['current_signal']['timestamp']}]")
             print(f"Signal: {status['current_signal']['signal']}")
             print(f"Price: ${status['current_signal']['price']:.2f}")
             print(f"RSI: {status['current_signal']['rsi']:.2f}")
             
-            # Check and execute
-            result = trader.check_and_execute(dry_run=dry_run)
-            
             print(f"Action: {result['action']}")
             print(f"Message: {result['message']}")
             
@@ -67,8 +67,13 @@ def run_live_trading(symbol: str, dry_run: bool = True, interval: int = 300):
             
             print("\n" + "-" * 60)
             
-            # Wait before next check
-            time.sleep(interval)
+            # Wait until the next scheduled check, resyncing if we fell behind
+            next_tick += interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()
             
     except KeyboardInterrupt:
         print("\n\nTrading bot stopped by user.")
@@ -8,7 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
 from strategy import TradingStrategy
-from data_fetcher import DataFetcher
+from data_fetcher import get_default_fetcher
 from backtester import Backtester
 
 
@@ -22,7 +22,7 @@ def quick_demo():
     
     # Step 1: Fetch data
     print("Step 1: Fetching market data...")
-    data_fetcher = DataFetcher(source='yfinance')
+    data_fetcher = get_default_fetcher()
     symbol = 'AAPL'
     
     try:
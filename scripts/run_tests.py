@@ -2,9 +2,10 @@
 Simple test runner script.
 Run this to execute all tests.
 """
-import subprocess
 import sys
 
+import pytest
+
 
 def run_tests():
     """Run pytest tests"""
@@ -13,13 +14,10 @@ def run_tests():
     print("=" * 60)
     print()
     
-    # Run pytest with verbose output
-    result = subprocess.run(
-        ['pytest', 'tests/', '-v', '--tb=short'],
-        capture_output=False
-    )
+    # Run pytest in this interpreter with verbose output
+    exit_code = pytest.main(['tests/', '-v', '--tb=short'])
     
-    return result.returncode == 0
+    return exit_code == 0
 
 
 if __name__ == '__main__':
@@ -10,8 +10,8 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from typing import Optional
-from strategies import list_strategies, DEFAULT_STRATEGY
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # ASCII art logo
 LOGO = """
@@ -29,52 +29,173 @@ LOGO = """
 ╚═══════════════════════════════════════════════════════════╝
 """
 
+# Expanded stock universe for better opportunity discovery
+IDENTIFY_SYMBOLS = (
+    # Mega Cap Tech
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA',
+    # Tech & Semiconductors
+    'AMD', 'INTC', 'AVGO', 'QCOM', 'MU', 'AMAT', 'LRCX', 'KLAC',
+    # Software & Cloud
+    'ORCL', 'CRM', 'ADBE', 'NOW', 'PANW', 'SNOW', 'DDOG',
+    # Streaming & Media
+    'NFLX', 'DIS', 'SPOT', 'RBLX',
+    # E-commerce & Payments
+    'SHOP', 'SQ', 'PYPL', 'V', 'MA',
+    # Auto & Energy
+    'F', 'GM', 'RIVN', 'LCID', 'XLE', 'XOM', 'CVX',
+    # Finance
+    'JPM', 'BAC', 'GS', 'MS', 'C', 'WFC',
+    # Healthcare & Biotech
+    'JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'DHR',
+    # Consumer
+    'WMT', 'TGT', 'COST', 'HD', 'LOW', 'NKE', 'SBUX',
+    # ETFs for broader signals
+    'SPY', 'QQQ', 'IWM', 'DIA', 'XLF', 'XLK', 'XLV',
+)
+
+# Stock universe for after-hours planning
+AFTER_HOURS_SYMBOLS = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA',
+    'TSLA', 'META', 'AMD', 'NFLX', 'INTC',
+    'V', 'MA', 'JPM', 'DIS', 'PYPL',
+    'ADBE', 'CRM', 'ORCL', 'CSCO', 'QCOM',
+)
+
+# Stock universe for strategy comparison
+COMPARISON_SYMBOLS = (
+    # Popular stocks for comparison
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA',
+    'META', 'AMD', 'INTC', 'NFLX', 'DIS',
+    'PYPL', 'SQ', 'SHOP', 'V', 'MA',
+    'JPM', 'BAC', 'WMT', 'TGT', 'COST',
+    'SPY', 'QQQ', 'IWM',
+)
+
+# Main menu, rendered with a single write per redraw
+MAIN_MENU = "\n".join([
+    "=" * 63,
+    "MAIN MENU",
+    "=" * 63,
+    "",
+    "  1. 🚀 Quick Start Demo        - See the system in action",
+    "  2. 🔍 Identify Stocks         - Find trading opportunities",
+    "  3. 📊 Run Backtest            - Test strategy on history",
+    "  4. 📈 Visualize Strategy      - Create strategy charts",
+    "  5. 🤖 Live Trading (Dry Run) - Simulate trading",
+    "  6. 💰 Live Trading (Paper)    - Trade with fake money",
+    "  7. ⚙️  Configuration          - View/edit settings",
+    "  8. 📋 View Logs               - Check recent logs",
+    "  9. 📊 Monitoring Report       - System health & metrics",
+    "  10. 🌙 After-Hours Planning   - Plan tomorrow's trades",
+    "  11. ⚖️  Compare Strategies     - Test all strategies side-by-side",
+    "",
+    "  0. ❌ Exit",
+    "",
+    "=" * 63,
+    "",
+])
+
+
+@lru_cache(maxsize=1)
+def _strategy_menu() -> Tuple[Tuple[str, ...], Tuple[str, ...], str]:
+    """
+    Build the strategy selection menu once.
+    
+    The strategies module (and with it pandas and numpy) is only imported here,
+    so the main menu comes up without paying for it.
+    
+    Returns:
+        Tuple of (strategy keys, display names, formatted menu lines)
+    """
+    from strategies import list_strategies, DEFAULT_STRATEGY
+    
+    strategies = list_strategies()
+    lines = []
+    for i, (name, info) in enumerate(strategies.items(), 1):
+        marker = " ⭐" if name == DEFAULT_STRATEGY else ""
+        lines.append(f"  {i}. {info['name']:12} - {info['description']}{marker}")
+    
+    names = tuple(strategies)
+    display_names = tuple(info['name'] for info in strategies.values())
+    return names, display_names, "\n".join(lines)
+
+
+def _tail_lines(path, count: int, block_size: int = 8192) -> List[str]:
+    """
+    Read the last lines of a file without loading all of it.
+    
+    Args:
+        path: File to read
+        count: Number of lines to return
+        block_size: Bytes read per step backwards from the end
+        
+    Returns:
+        Up to `count` last lines of the file
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # One extra newline so a trailing newline doesn't cost a line
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    
+    return data.decode('utf-8', errors='replace').splitlines()[-count:]
+
 
 class StockerUI:
     """Interactive console UI for the trading system"""
     
     def __init__(self):
         self.running = True
+        self.ansi_supported = self._enable_ansi()
+    
+    @staticmethod
+    def _enable_ansi() -> bool:
+        """Make sure the console understands ANSI escapes (Windows 10+ needs VT mode)"""
+        if os.name != 'nt':
+            return True
+        
+        try:
+            import ctypes
+            
+            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+        except Exception:
+            return False
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        if self.ansi_supported:
+            # Clear and home the cursor directly instead of spawning a shell
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
+        else:
+            os.system('cls')
     
     def print_header(self):
         """Print the application header"""
         self.clear_screen()
-        print(LOGO)
-        print()
+        sys.stdout.write(LOGO + "\n\n")
     
     def print_menu(self):
         """Print the main menu"""
-        print("=" * 63)
-        print("MAIN MENU")
-        print("=" * 63)
-        print()
-        print("  1. 🚀 Quick Start Demo        - See the system in action")
-        print("  2. 🔍 Identify Stocks         - Find trading opportunities")
-        print("  3. 📊 Run Backtest            - Test strategy on history")
-        print("  4. 📈 Visualize Strategy      - Create strategy charts")
-        print("  5. 🤖 Live Trading (Dry Run) - Simulate trading")
-        print("  6. 💰 Live Trading (Paper)    - Trade with fake money")
-        print("  7. ⚙️  Configuration          - View/edit settings")
-        print("  8. 📋 View Logs               - Check recent logs")
-        print("  9. 📊 Monitoring Report       - System health & metrics")
-        print("  10. 🌙 After-Hours Planning   - Plan tomorrow's trades")
-        print("  11. ⚖️  Compare Strategies     - Test all strategies side-by-side")
-        print()
-        print("  0. ❌ Exit")
-        print()
-        print("=" * 63)
+        sys.stdout.write(MAIN_MENU)
+        sys.stdout.flush()
     
     def get_input(self, prompt: str, default: Optional[str] = None) -> str:
         """Get user input with optional default"""
-        if default:
-            prompt = f"{prompt} (default: {default})"
+        if not default:
+            return input(f"{prompt}: ").strip()
         
-        value = input(f"{prompt}: ").strip()
-        return value if value else (default if default else "")
+        return input(f"{prompt} (default: {default}): ").strip() or default
     
     def select_strategy(self) -> str:
         """Let user select a strategy"""
@@ -82,25 +203,21 @@ class StockerUI:
         print(" SELECT TRADING STRATEGY")
         print("=" * 63)
         
-        strategies = list_strategies()
-        strategy_names = list(strategies.keys())
-        
-        for i, (name, info) in enumerate(strategies.items(), 1):
-            marker = " ⭐" if name == DEFAULT_STRATEGY else ""
-            print(f"  {i}. {info['name']:12} - {info['description']}{marker}")
+        strategy_names, display_names, menu = _strategy_menu()
+        print(menu)
         
         print()
-        choice = self.get_input(f"Choose strategy (1-{len(strategies)})", "2")
+        choice = self.get_input(f"Choose strategy (1-{len(strategy_names)})", "2")
         
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(strategy_names):
-                selected = strategy_names[idx]
-                print(f"\n✅ Selected: {strategies[selected]['name']}")
-                return selected
+                print(f"\n✅ Selected: {display_names[idx]}")
+                return strategy_names[idx]
         except (ValueError, IndexError):
             pass
         
+        from strategies import DEFAULT_STRATEGY
         print(f"\n⚠️  Invalid choice, using default: {DEFAULT_STRATEGY}")
         return DEFAULT_STRATEGY
     
@@ -141,40 +258,23 @@ class StockerUI:
         print()
         try:
             # Import and run
-            import pandas as pd
             from identify_stock import identify_potential_stocks
             
-            # Expanded stock universe for better opportunity discovery
-            symbols = [
-                # Mega Cap Tech
-                'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA',
-                # Tech & Semiconductors
-                'AMD', 'INTC', 'AVGO', 'QCOM', 'MU', 'AMAT', 'LRCX', 'KLAC',
-                # Software & Cloud
-                'ORCL', 'CRM', 'ADBE', 'NOW', 'PANW', 'SNOW', 'DDOG',
-                # Streaming & Media
-                'NFLX', 'DIS', 'SPOT', 'RBLX',
-                # E-commerce & Payments
-                'SHOP', 'SQ', 'PYPL', 'V', 'MA',
-                # Auto & Energy
-                'F', 'GM', 'RIVN', 'LCID', 'XLE', 'XOM', 'CVX',
-                # Finance
-                'JPM', 'BAC', 'GS', 'MS', 'C', 'WFC',
-                # Healthcare & Biotech
-                'JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'DHR',
-                # Consumer
-                'WMT', 'TGT', 'COST', 'HD', 'LOW', 'NKE', 'SBUX',
-                # ETFs for broader signals
-                'SPY', 'QQQ', 'IWM', 'DIA', 'XLF', 'XLK', 'XLV'
-            ]
-            
-            results = identify_potential_stocks(symbols, strategy_name=strategy_name)
+            results = identify_potential_stocks(IDENTIFY_SYMBOLS, strategy_name=strategy_name, top_n=10)
             
             if not results.empty:
-                print("\n" + "=" * 63)
-                print("TOP TRADING OPPORTUNITIES")
-                print("=" * 63)
-                print(results[['symbol', 'signal', 'signal_strength', 'price', 'rsi']].head(10).to_string(index=False))
+                lines = [
+                    "\n" + "=" * 63,
+                    "TOP TRADING OPPORTUNITIES",
+                    "=" * 63,
+                    f"{'symbol':<6}  {'signal':<10}  {'signal_strength':>15}  {'price':>9}  {'rsi':>5}",
+                ]
+                lines.extend(
+                    f"{row.symbol:<6}  {row.signal:<10}  {row.signal_strength:>15.1f}  "
+                    f"{row.price:>9.2f}  {row.rsi:>5.1f}"
+                    for row in results.head(10).itertuples(index=False)
+                )
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print("\n❌ No opportunities found.")
         
@@ -276,8 +376,8 @@ class StockerUI:
         print()
         
         # Check for credentials
-        from config import Config
-        config = Config()
+        from config import get_config
+        config = get_config()
         if not config.ALPACA_API_KEY or not config.ALPACA_SECRET_KEY:
             print("❌ Error: Alpaca API credentials not configured!")
             print("Please set ALPACA_API_KEY and ALPACA_SECRET_KEY in .env file.")
@@ -314,40 +414,39 @@ class StockerUI:
     def show_configuration(self):
         """Display current configuration"""
         self.print_header()
-        print("⚙️  CONFIGURATION")
-        print("=" * 63)
-        print()
-        
-        from config import Config
-        config = Config()
-        
-        print("Trading Parameters:")
-        print(f"  Max Position Size:    ${config.MAX_POSITION_SIZE:,.2f}")
-        print(f"  Risk Per Trade:       {config.RISK_PER_TRADE * 100:.1f}%")
-        print(f"  Stop Loss:            {config.STOP_LOSS_PCT * 100:.1f}%")
-        print(f"  Take Profit:          {config.TAKE_PROFIT_PCT * 100:.1f}%")
-        print()
-        
-        print("Strategy Parameters:")
-        print(f"  RSI Period:           {config.RSI_PERIOD}")
-        print(f"  RSI Oversold:         {config.RSI_OVERSOLD}")
-        print(f"  RSI Overbought:       {config.RSI_OVERBOUGHT}")
-        print(f"  Fast MA Period:       {config.FAST_MA_PERIOD}")
-        print(f"  Slow MA Period:       {config.SLOW_MA_PERIOD}")
-        print()
         
-        print("Data Parameters:")
-        print(f"  Timeframe:            {config.DATA_TIMEFRAME}")
-        print(f"  Lookback Days:        {config.LOOKBACK_DAYS}")
-        print()
-        
-        print("API Configuration:")
+        from config import get_config
+        config = get_config()
         api_configured = bool(config.ALPACA_API_KEY and config.ALPACA_SECRET_KEY)
-        print(f"  Alpaca API:           {'✅ Configured' if api_configured else '❌ Not configured'}")
-        print(f"  Base URL:             {config.ALPACA_BASE_URL}")
-        print()
         
-        print("To modify settings, edit your .env file or config.py")
+        lines = [
+            "⚙️  CONFIGURATION",
+            "=" * 63,
+            "",
+            "Trading Parameters:",
+            f"  Max Position Size:    ${config.MAX_POSITION_SIZE:,.2f}",
+            f"  Risk Per Trade:       {config.RISK_PER_TRADE * 100:.1f}%",
+            f"  Stop Loss:            {config.STOP_LOSS_PCT * 100:.1f}%",
+            f"  Take Profit:          {config.TAKE_PROFIT_PCT * 100:.1f}%",
+            "",
+            "Strategy Parameters:",
+            f"  RSI Period:           {config.RSI_PERIOD}",
+            f"  RSI Oversold:         {config.RSI_OVERSOLD}",
+            f"  RSI Overbought:       {config.RSI_OVERBOUGHT}",
+            f"  Fast MA Period:       {config.FAST_MA_PERIOD}",
+            f"  Slow MA Period:       {config.SLOW_MA_PERIOD}",
+            "",
+            "Data Parameters:",
+            f"  Timeframe:            {config.DATA_TIMEFRAME}",
+            f"  Lookback Days:        {config.LOOKBACK_DAYS}",
+            "",
+            "API Configuration:",
+            f"  Alpaca API:           {'✅ Configured' if api_configured else '❌ Not configured'}",
+            f"  Base URL:             {config.ALPACA_BASE_URL}",
+            "",
+            "To modify settings, edit your .env file or config.py",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         self.pause()
     
@@ -358,29 +457,30 @@ class StockerUI:
         print("=" * 63)
         print()
         
-        import glob
-        from pathlib import Path
-        
-        log_files = list(Path('logs').glob('*.log')) if Path('logs').exists() else []
-        
-        if not log_files:
+        # Find the most recent log file in a single directory scan
+        try:
+            with os.scandir('logs') as entries:
+                latest_log = max(
+                    (entry for entry in entries if entry.name.endswith('.log') and entry.is_file()),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            latest_log = None
+        
+        if latest_log is None:
             print("No log files found.")
             print("Logs will be created when logging is enabled.")
             self.pause()
             return
         
-        # Get most recent log file
-        latest_log = max(log_files, key=lambda p: p.stat().st_mtime)
-        
         print(f"Showing last 50 lines from: {latest_log.name}")
         print("=" * 63)
         print()
         
         try:
-            with open(latest_log, 'r') as f:
-                lines = f.readlines()
-                for line in lines[-50:]:
-                    print(line.rstrip())
+            for line in _tail_lines(latest_log.path, 50):
+                print(line.rstrip())
         except Exception as e:
             print(f"❌ Error reading log: {e}")
         
@@ -389,52 +489,55 @@ class StockerUI:
     def show_monitoring_report(self):
         """Display monitoring metrics"""
         self.print_header()
-        print("📊 MONITORING REPORT")
-        print("=" * 63)
-        print()
+        lines = ["📊 MONITORING REPORT", "=" * 63, ""]
         
         try:
             from monitoring import get_monitor
             monitor = get_monitor()
             summary = monitor.get_summary()
             
-            print("System Health:")
-            print(f"  Uptime:               {summary['uptime_seconds']:.0f} seconds")
-            print()
+            lines.append("System Health:")
+            lines.append(f"  Uptime:               {summary['uptime_seconds']:.0f} seconds")
+            lines.append("")
             
-            print("Errors:")
-            print(f"  Total Errors:         {summary['errors']['total']}")
-            print(f"  Error Rate:           {summary['errors']['rate_per_minute']:.2f}/min")
+            lines.append("Errors:")
+            lines.append(f"  Total Errors:         {summary['errors']['total']}")
+            lines.append(f"  Error Rate:           {summary['errors']['rate_per_minute']:.2f}/min")
             if summary['errors']['by_category']:
-                print(f"  By Category:          {summary['errors']['by_category']}")
-            print()
+                lines.append(f"  By Category:          {summary['errors']['by_category']}")
+                lines.append(f"  Last Seen:            {summary['errors']['last_seen']}")
+            lines.append("")
             
-            print("Warnings:")
-            print(f"  Total Warnings:       {summary['warnings']['total']}")
+            lines.append("Warnings:")
+            lines.append(f"  Total Warnings:       {summary['warnings']['total']}")
             if summary['warnings']['by_category']:
-                print(f"  By Category:          {summary['warnings']['by_category']}")
-            print()
+                lines.append(f"  By Category:          {summary['warnings']['by_category']}")
+                lines.append(f"  Last Seen:            {summary['warnings']['last_seen']}")
+            lines.append("")
             
-            print("Metrics:")
+            lines.append("Metrics:")
             if summary['metrics']:
                 for key, value in list(summary['metrics'].items())[:10]:
-                    print(f"  {key:<20}  {value}")
+                    lines.append(f"  {key:<20}  {value}")
             else:
-                print("  No metrics recorded yet")
-            print()
+                lines.append("  No metrics recorded yet")
+            lines.append("")
             
-            print("Performance:")
+            lines.append("Performance:")
             if summary['timings']:
                 for op, stats in summary['timings'].items():
-                    print(f"  {op}:")
-                    print(f"    Count:    {stats['count']}")
-                    print(f"    Avg:      {stats['avg_ms']:.2f}ms")
-                    print(f"    Min/Max:  {stats['min_ms']:.2f}ms / {stats['max_ms']:.2f}ms")
+                    lines.append(f"  {op}:")
+                    lines.append(f"    Count:    {stats['count']}")
+                    lines.append(f"    Avg:      {stats['avg_ms']:.2f}ms")
+                    lines.append(f"    Min/Max:  {stats['min_ms']:.2f}ms / {stats['max_ms']:.2f}ms")
+                    lines.append(f"    P50/P99:  {stats['p50_ms']:.2f}ms / {stats['p99_ms']:.2f}ms")
             else:
-                print("  No timing data yet")
+                lines.append("  No timing data yet")
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            lines.append(f"❌ Error: {e}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         self.pause()
     
@@ -453,18 +556,10 @@ class StockerUI:
         
         print()
         
-        # Stock universe to analyze
-        symbols = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA',
-            'TSLA', 'META', 'AMD', 'NFLX', 'INTC',
-            'V', 'MA', 'JPM', 'DIS', 'PYPL',
-            'ADBE', 'CRM', 'ORCL', 'CSCO', 'QCOM'
-        ]
-        
         try:
             from after_hours_planning import analyze_for_tomorrow, print_trading_plan, save_trading_plan
             
-            plan = analyze_for_tomorrow(symbols, strategy_name)
+            plan = analyze_for_tomorrow(AFTER_HOURS_SYMBOLS, strategy_name)
             print_trading_plan(plan)
             
             # Save plan
@@ -488,28 +583,18 @@ class StockerUI:
         print("on the same stocks. See which strategy works best!")
         print()
         
-        # Stock universe to analyze
-        symbols = [
-            # Popular stocks for comparison
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA',
-            'META', 'AMD', 'INTC', 'NFLX', 'DIS',
-            'PYPL', 'SQ', 'SHOP', 'V', 'MA',
-            'JPM', 'BAC', 'WMT', 'TGT', 'COST',
-            'SPY', 'QQQ', 'IWM'
-        ]
-        
         try:
             from data_cache import DataCache, compare_strategies_on_cached_data, print_strategy_comparison
             
             # Create cache and fetch data once
-            cache = DataCache()
+            cache = DataCache(downcast=True)
             print("Fetching data (this will take ~30 seconds)...")
             print()
-            cache.fetch_and_cache(symbols, period=30)
+            cache.fetch_and_cache(COMPARISON_SYMBOLS, period=30)
             
             # Compare strategies
             print("\nAnalyzing with all strategies...")
-            comparison = compare_strategies_on_cached_data(cache, symbols)
+            comparison = compare_strategies_on_cached_data(cache, COMPARISON_SYMBOLS)
             
             # Display results
             print_strategy_comparison(comparison)
@@ -13,7 +13,7 @@ from datetime import datetime
 import pandas as pd
 from strategy import TradingStrategy
 from data_fetcher import DataFetcher
-from config import Config
+from config import get_config
 
 
 def visualize_strategy(symbol: str, days: int = 30):
@@ -32,6 +32,7 @@ def visualize_strategy(symbol: str, days: int = 30):
     
     # Analyze
     strategy = TradingStrategy()
+    config = get_config()
     analyzed_df = strategy.analyze(df)
     
     # Create figure with subplots
@@ -41,9 +42,9 @@ def visualize_strategy(symbol: str, days: int = 30):
     # Plot 1: Price and Moving Averages
     ax1 = axes[0]
     ax1.plot(analyzed_df.index, analyzed_df['close'], label='Price', linewidth=2, color='black')
-    ax1.plot(analyzed_df.index, analyzed_df['fast_ma'], label=f'Fast MA ({Config().FAST_MA_PERIOD})', 
+    ax1.plot(analyzed_df.index, analyzed_df['fast_ma'], label=f'Fast MA ({config.FAST_MA_PERIOD})', 
              linewidth=1.5, color='blue', alpha=0.7)
-    ax1.plot(analyzed_df.index, analyzed_df['slow_ma'], label=f'Slow MA ({Config().SLOW_MA_PERIOD})', 
+    ax1.plot(analyzed_df.index, analyzed_df['slow_ma'], label=f'Slow MA ({config.SLOW_MA_PERIOD})', 
              linewidth=1.5, color='red', alpha=0.7)
     
     # Mark buy/sell signals
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from strategies import get_strategy, StrategyProfile, DEFAULT_STRATEGY
 from data_fetcher import DataFetcher
-from config import Config
+from config import Config, get_config
 
 
 class Backtester:
@@ -28,7 +28,7 @@ class Backtester:
             strategy_name: Name of strategy to use if strategy not provided
         """
         self.initial_capital = initial_capital
-        self.config = config or Config()
+        self.config = config or get_config()
         self.strategy = strategy or get_strategy(strategy_name, self.config)
         self.data_fetcher = DataFetcher(source='yfinance')
     
@@ -50,10 +50,11 @@ class Backtester:
         fetch_period = 180 if not start_date else None
         df = self.data_fetcher.fetch_data(symbol, period=fetch_period) if fetch_period else self.data_fetcher.fetch_data(symbol)
         
+        # The index is sorted, so find the date bounds by binary search
         if start_date:
-            df = df[df.index >= start_date]
+            df = df.iloc[df.index.searchsorted(start_date, side='left'):]
         if end_date:
-            df = df[df.index <= end_date]
+            df = df.iloc[:df.index.searchsorted(end_date, side='right')]
         
         if df.empty:
             raise ValueError(f"No data available for {symbol} in the specified date range")
@@ -77,110 +78,126 @@ class Backtester:
             List of trades and portfolio value over time
         """
         capital = self.initial_capital
-        position = None  # None, or {'shares': int, 'entry_price': float, 'entry_time': datetime}
         trades = []
-        portfolio_values = []
         
-        for idx, row in df.iterrows():
-            current_price = row['close']
-            signal = row['signal']
+        # Work on raw arrays; only the close and signal columns are needed
+        closes = df['close'].to_numpy(dtype=np.float64)
+        signals = df['signal'].to_numpy()
+        index = df.index
+        n = len(closes)
+        portfolio_values = np.empty(n, dtype=np.float64)
+        buy_bars = np.flatnonzero(signals == 1)
+        
+        # Jump from event to event instead of stepping through every bar:
+        # while flat only the next buy signal matters, while holding only the
+        # first bar that hits the stop, the target or a sell signal.
+        i = 0
+        while i < n:
+            next_buy = np.searchsorted(buy_bars, i)
+            if next_buy == len(buy_bars):
+                portfolio_values[i:] = capital
+                break
             
-            # Check stop loss and take profit for existing position
-            if position is not None:
-                stop_loss = position['entry_price'] * (1 - self.config.STOP_LOSS_PCT)
-                take_profit = position['entry_price'] * (1 + self.config.TAKE_PROFIT_PCT)
-                
-                if current_price <= stop_loss or current_price >= take_profit:
-                    # Exit position
-                    pnl = (current_price - position['entry_price']) * position['shares']
-                    capital += current_price * position['shares']
-                    
-                    trades.append({
-                        'entry_time': position['entry_time'],
-                        'exit_time': idx,
-                        'entry_price': position['entry_price'],
-                        'exit_price': current_price,
-                        'shares': position['shares'],
-                        'pnl': pnl,
-                        'return_pct': (current_price - position['entry_price']) / position['entry_price'] * 100,
-                        'exit_reason': 'stop_loss' if current_price <= stop_loss else 'take_profit'
-                    })
-                    
-                    position = None
+            entry = buy_bars[next_buy]
+            portfolio_values[i:entry] = capital
+            entry_price = closes[entry]
+            shares = self._position_size(capital, entry_price)
+            if not shares:
+                portfolio_values[entry] = capital
+                i = entry + 1
+                continue
             
-            # Open new position on buy signal
-            if signal == 1 and position is None:
-                # Calculate position size based on risk
-                risk_amount = capital * self.config.RISK_PER_TRADE
-                stop_loss_price = current_price * (1 - self.config.STOP_LOSS_PCT)
-                risk_per_share = current_price - stop_loss_price
-                
-                if risk_per_share > 0:
-                    shares = int(risk_amount / risk_per_share)
-                    max_shares = int(self.config.MAX_POSITION_SIZE / current_price)
-                    shares = min(shares, max_shares)
-                    
-                    if shares > 0 and capital >= shares * current_price:
-                        cost = shares * current_price
-                        capital -= cost
-                        position = {
-                            'shares': shares,
-                            'entry_price': current_price,
-                            'entry_time': idx
-                        }
+            capital -= shares * entry_price
+            portfolio_values[entry] = capital + shares * entry_price
             
-            # Close position on sell signal
-            elif signal == -1 and position is not None:
-                pnl = (current_price - position['entry_price']) * position['shares']
-                capital += current_price * position['shares']
-                
-                trades.append({
-                    'entry_time': position['entry_time'],
-                    'exit_time': idx,
-                    'entry_price': position['entry_price'],
-                    'exit_price': current_price,
-                    'shares': position['shares'],
-                    'pnl': pnl,
-                    'return_pct': (current_price - position['entry_price']) / position['entry_price'] * 100,
-                    'exit_reason': 'signal'
-                })
+            # Find the bar that closes the position
+            stop_loss = entry_price * (1 - self.config.STOP_LOSS_PCT)
+            take_profit = entry_price * (1 + self.config.TAKE_PROFIT_PCT)
+            held = closes[entry + 1:]
+            hit_limit = (held <= stop_loss) | (held >= take_profit)
+            exits = np.flatnonzero(hit_limit | (signals[entry + 1:] == -1))
+            
+            if not len(exits):
+                # Close any remaining open position at the end of backtest
+                portfolio_values[entry + 1:] = capital + shares * held
+                capital += closes[-1] * shares
+                trades.append(self._close_trade(
+                    index[entry], index[-1], entry_price, closes[-1], shares, 'end_of_backtest'
+                ))
                 
-                position = None
+                # Update final portfolio value
+                portfolio_values[-1] = capital
+                break
             
-            # Calculate portfolio value
-            portfolio_value = capital
-            if position is not None:
-                portfolio_value += position['shares'] * current_price
+            exit_bar = entry + 1 + exits[0]
+            portfolio_values[entry + 1:exit_bar] = capital + shares * held[:exits[0]]
+            exit_price = closes[exit_bar]
+            capital += exit_price * shares
             
-            portfolio_values.append(portfolio_value)
+            if hit_limit[exits[0]]:
+                reason = 'stop_loss' if exit_price <= stop_loss else 'take_profit'
+                trades.append(self._close_trade(
+                    index[entry], index[exit_bar], entry_price, exit_price, shares, reason
+                ))
+                # A buy signal on the exit bar may open a new position right away
+                i = exit_bar
+            else:
+                trades.append(self._close_trade(
+                    index[entry], index[exit_bar], entry_price, exit_price, shares, 'signal'
+                ))
+                portfolio_values[exit_bar] = capital
+                i = exit_bar + 1
+        
+        portfolio_series = pd.Series(portfolio_values, index=index)
         
-        # Close any remaining open position at the end of backtest
-        if position is not None:
-            final_price = df.iloc[-1]['close']
-            pnl = (final_price - position['entry_price']) * position['shares']
-            capital += final_price * position['shares']
+        return trades, portfolio_series
+    
+    def _position_size(self, capital: float, price: float) -> int:
+        """
+        Calculate how many shares to buy based on risk.
+        
+        Args:
+            capital: Cash available
+            price: Entry price
             
-            trades.append({
-                'entry_time': position['entry_time'],
-                'exit_time': df.index[-1],
-                'entry_price': position['entry_price'],
-                'exit_price': final_price,
-                'shares': position['shares'],
-                'pnl': pnl,
-                'return_pct': (final_price - position['entry_price']) / position['entry_price'] * 100,
-                'exit_reason': 'end_of_backtest'
-            })
+        Returns:
+            Number of shares, or 0 if no position can be opened
+        """
+        risk_amount = capital * self.config.RISK_PER_TRADE
+        stop_loss_price = price * (1 - self.config.STOP_LOSS_PCT)
+        risk_per_share = price - stop_loss_price
+        
+        if risk_per_share > 0:
+            shares = int(risk_amount / risk_per_share)
+            max_shares = int(self.config.MAX_POSITION_SIZE / price)
+            shares = min(shares, max_shares)
             
-            # Update final portfolio value
-            portfolio_values[-1] = capital
+            if shares > 0 and capital >= shares * price:
+                return shares
         
-        portfolio_series = pd.Series(portfolio_values, index=df.index)
-        
-        return trades, portfolio_series
+        return 0
+    
+    @staticmethod
+    def _close_trade(entry_time, exit_time, entry_price: float, exit_price: float,
+                     shares: int, exit_reason: str) -> Dict:
+        """Build the trade record for a closed position"""
+        return {
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'entry_price': entry_price,
+            'exit_price': exit_price,
+            'shares': shares,
+            'pnl': (exit_price - entry_price) * shares,
+            'return_pct': (exit_price - entry_price) / entry_price * 100,
+            'exit_reason': exit_reason
+        }
     
     def _calculate_metrics(self, trades: List[Dict], portfolio_value: pd.Series, 
                           df: pd.DataFrame) -> Dict:
         """Calculate performance metrics"""
+        # Keyed by timestamp string for JSON output
+        portfolio_dict = dict(zip(map(str, portfolio_value.index), portfolio_value.tolist()))
+        
         if not trades:
             return {
                 'initial_capital': self.initial_capital,
@@ -192,10 +209,11 @@ class Backtester:
                 'avg_return': 0,
                 'max_drawdown': 0,
                 'trades': [],
-                'portfolio_value': {str(k): v for k, v in portfolio_value.to_dict().items()}
+                'portfolio_value': portfolio_dict
             }
         
-        trades_df = pd.DataFrame(trades)
+        pnl = np.array([trade['pnl'] for trade in trades], dtype=np.float64)
+        returns = np.array([trade['return_pct'] for trade in trades], dtype=np.float64)
         
         # Basic metrics
         final_capital = portfolio_value.iloc[-1]
@@ -203,16 +221,16 @@ class Backtester:
         total_return_pct = (total_return / self.initial_capital) * 100
         
         # Win rate
-        winning_trades = trades_df[trades_df['pnl'] > 0]
-        win_rate = len(winning_trades) / len(trades_df) * 100 if len(trades_df) > 0 else 0
+        win_rate = np.count_nonzero(pnl > 0) / len(pnl) * 100
         
         # Average return
-        avg_return = trades_df['return_pct'].mean()
+        avg_return = np.nanmean(returns)
         
-        # Maximum drawdown
-        running_max = portfolio_value.expanding().max()
-        drawdown = (portfolio_value - running_max) / running_max * 100
-        max_drawdown = drawdown.min()
+        # Maximum drawdown (fmax skips missing values like a pandas running max)
+        values = portfolio_value.to_numpy(dtype=np.float64)
+        running_max = np.fmax.accumulate(values)
+        drawdown = (values - running_max) / running_max * 100
+        max_drawdown = np.nanmin(drawdown)
         
         return {
             'initial_capital': self.initial_capital,
@@ -224,6 +242,6 @@ class Backtester:
             'avg_return': float(avg_return),
             'max_drawdown': float(max_drawdown),
             'trades': trades,
-            'portfolio_value': {str(k): v for k, v in portfolio_value.to_dict().items()}
+            'portfolio_value': portfolio_dict
         }
 
@@ -18,6 +18,12 @@ class Backtester:
     
     def _simulate_trades(self, df: pd.DataFrame) -> Tuple[List[Dict], pd.Series]: ...
     
+    def _position_size(self, capital: float, price: float) -> int: ...
+    
+    @staticmethod
+    def _close_trade(entry_time, exit_time, entry_price: float, exit_price: float,
+                     shares: int, exit_reason: str) -> Dict: ...
+    
     def _calculate_metrics(self, trades: List[Dict], portfolio_value: pd.Series, 
                           df: pd.DataFrame) -> Dict: ...
 
@@ -4,7 +4,7 @@ Currently supports Alpaca API for paper and live trading.
 """
 from typing import Dict, Optional, List
 from datetime import datetime
-from config import Config
+from config import Config, get_config
 
 
 class Broker:
@@ -21,7 +21,7 @@ class Broker:
             config: Configuration object
             paper_trading: If True, use paper trading account
         """
-        self.config = config or Config()
+        self.config = config or get_config()
         self.paper_trading = paper_trading
         self.api = None
         self._connect()
@@ -3,6 +3,7 @@ Configuration management for the trading system.
 Loads settings from environment variables with sensible defaults.
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -31,4 +32,18 @@ class Config:
     # Data parameters
     DATA_TIMEFRAME = '5m'  # 5-minute candles for day trading
     LOOKBACK_DAYS = 30  # Days of historical data to fetch
+    DATA_CACHE_DIR = os.getenv('DATA_CACHE_DIR', '.cache/bars')  # On-disk bar cache ('' disables)
 
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the shared configuration instance.
+    
+    Settings are read from the environment once at import time, so every
+    component can share a single Config instead of constructing its own.
+    
+    Returns:
+        Shared Config instance
+    """
+    return Config()
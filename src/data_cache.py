@@ -5,7 +5,7 @@ Allows fetching data once and applying multiple strategies without repeated API
 
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from data_fetcher import DataFetcher
 import json
 import os
@@ -17,22 +17,27 @@ class DataCache:
     Stores fetched data in memory and optionally persists to disk.
     """
     
-    def __init__(self, cache_dir: str = ".cache"):
+    def __init__(self, cache_dir: str = ".cache", downcast: bool = False):
         """
         Initialize data cache.
         
         Args:
             cache_dir: Directory to store cache files
+            downcast: If True, cache float32 prices and compact volume to
+                halve the memory held per symbol
         """
         self.cache_dir = cache_dir
+        self.downcast = downcast
         self.memory_cache: Dict[str, pd.DataFrame] = {}
         self.cache_metadata: Dict[str, dict] = {}
+        # strategy name -> ((symbol, fetched_at) pairs analyzed, latest-bar results)
+        self.analysis_cache: Dict[str, Tuple[Tuple[Tuple[str, str], ...], pd.DataFrame]] = {}
         
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
     
     def fetch_and_cache(self, symbols: List[str], period: int = 30, 
-                       source: str = 'yfinance') -> Dict[str, pd.DataFrame]:
+                       source: str = 'yfinance', max_workers: int = 16) -> Dict[str, pd.DataFrame]:
         """
         Fetch data for multiple symbols and cache them.
         
@@ -40,41 +45,51 @@ class DataCache:
             symbols: List of stock symbols
             period: Number of days to fetch
             source: Data source ('yfinance' or 'alpaca')
+            max_workers: Maximum number of concurrent downloads
             
         Returns:
             Dictionary mapping symbols to DataFrames
         """
-        data_fetcher = DataFetcher(source=source)
+        data_fetcher = DataFetcher(source=source, downcast=self.downcast)
         results = {}
         
         print(f"Fetching data for {len(symbols)} symbols...")
         
-        for symbol in symbols:
+        # Download every stale symbol in one batch, then report in order
+        stale = [symbol for symbol in symbols if not self._is_cache_valid(symbol, period)]
+        fetched = {}
+        batch_error = None
+        if stale:
             try:
-                # Check if we have valid cached data
-                if self._is_cache_valid(symbol, period):
-                    print(f"✓ {symbol:<6} (cached)")
-                    results[symbol] = self.memory_cache[symbol]
-                else:
-                    # Fetch fresh data
-                    df = data_fetcher.fetch_data(symbol, period=period)
-                    
-                    # Cache it
-                    self.memory_cache[symbol] = df
-                    self.cache_metadata[symbol] = {
-                        'fetched_at': datetime.now().isoformat(),
-                        'period': period,
-                        'rows': len(df),
-                        'start_date': str(df.index[0]) if not df.empty else None,
-                        'end_date': str(df.index[-1]) if not df.empty else None
-                    }
-                    
-                    results[symbol] = df
-                    print(f"✓ {symbol:<6} (fetched {len(df)} rows)")
-                    
+                fetched = data_fetcher.fetch_batch(stale, period=period, max_workers=max_workers)
             except Exception as e:
-                print(f"✗ {symbol:<6} - Error: {str(e)[:50]}")
+                batch_error = e
+        
+        for symbol in symbols:
+            # Check if we have valid cached data
+            if symbol not in stale:
+                print(f"✓ {symbol:<6} (cached)")
+                results[symbol] = self.memory_cache[symbol]
+                continue
+            
+            df = fetched.get(symbol)
+            if df is None:
+                error = batch_error or f"No data found for symbol: {symbol}"
+                print(f"✗ {symbol:<6} - Error: {str(error)[:50]}")
                 continue
+            
+            # Cache it
+            self.memory_cache[symbol] = df
+            self.cache_metadata[symbol] = {
+                'fetched_at': datetime.now().isoformat(),
+                'period': period,
+                'rows': len(df),
+                'start_date': str(df.index[0]),
+                'end_date': str(df.index[-1])
+            }
+            
+            results[symbol] = df
+            print(f"✓ {symbol:<6} (fetched {len(df)} rows)")
         
         return results
     
@@ -124,6 +139,40 @@ class DataCache:
         """
         return self.memory_cache.get(symbol)
     
+    def get_latest_signals(self, strategy_name: str, symbols: List[str],
+                           shared: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Get a strategy's latest-bar analysis of cached symbols.
+        
+        The batch result is reused until the symbol list changes or any of
+        the symbols is fetched again.
+        
+        Args:
+            strategy_name: Name of the strategy to apply
+            symbols: Symbols to analyze; ones not cached are left out
+            shared: Indicator dictionary passed on to analyze_batch so
+                strategies analyzing the same symbols share indicators
+            
+        Returns:
+            DataFrame indexed by symbol, as returned by analyze_batch
+        """
+        frames = {}
+        for symbol in symbols:
+            df = self.memory_cache.get(symbol)
+            if df is not None and not df.empty:
+                frames[symbol] = df
+        
+        stamp = tuple((symbol, self.cache_metadata.get(symbol, {}).get('fetched_at'))
+                      for symbol in frames)
+        cached = self.analysis_cache.get(strategy_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        from strategies import get_strategy
+        latest = get_strategy(strategy_name).analyze_batch(frames, shared)
+        self.analysis_cache[strategy_name] = (stamp, latest)
+        return latest
+    
     def get_cache_info(self) -> Dict:
         """
         Get information about cached data.
@@ -141,6 +190,7 @@ class DataCache:
         """Clear all cached data"""
         self.memory_cache.clear()
         self.cache_metadata.clear()
+        self.analysis_cache.clear()
     
     def save_to_disk(self, filename: Optional[str] = None):
         """
@@ -154,13 +204,14 @@ class DataCache:
         
         filepath = os.path.join(self.cache_dir, filename)
         
-        # Save DataFrames as pickle
+        # Save DataFrames as pickle; the newest protocol writes array buffers
+        # without the extra copies older protocols make
         import pickle
         with open(filepath, 'wb') as f:
             pickle.dump({
                 'data': self.memory_cache,
                 'metadata': self.cache_metadata
-            }, f)
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
         
         print(f"Cache saved to: {filepath}")
         return filepath
@@ -179,6 +230,7 @@ class DataCache:
             data = pickle.load(f)
             self.memory_cache = data['data']
             self.cache_metadata = data['metadata']
+        self.analysis_cache.clear()
         
         print(f"Cache loaded from: {filepath}")
         print(f"Loaded {len(self.memory_cache)} symbols")
@@ -197,8 +249,6 @@ def compare_strategies_on_cached_data(cache: DataCache, symbols: List[str],
     Returns:
         DataFrame with comparison results
     """
-    from strategies import get_strategy
-    
     if strategy_names is None:
         strategy_names = ['conservative', 'balanced', 'aggressive']
     
@@ -207,41 +257,38 @@ def compare_strategies_on_cached_data(cache: DataCache, symbols: List[str],
     print(f"\nComparing {len(strategy_names)} strategies on {len(symbols)} stocks...")
     print()
     
+    frames = {}
     for symbol in symbols:
         df = cache.get_cached_data(symbol)
-        if df is None or df.empty:
+        if df is not None and not df.empty:
+            frames[symbol] = df
+    
+    # Each strategy analyzes every symbol's latest bar in one batch, sharing
+    # the indicators the strategies have in common; repeat comparisons on
+    # unchanged data reuse the cache's earlier results
+    shared = {}
+    latest = {name: cache.get_latest_signals(name, list(frames), shared) for name in strategy_names}
+    
+    for symbol in frames:
+        if not all(symbol in results.index for results in latest.values()):
+            print(f"✗ {symbol} - Error: missing price data")
             continue
         
-        try:
-            latest_price = df['close'].iloc[-1]
-            latest_rsi = None
-            
-            # Analyze with each strategy
-            row = {
-                'symbol': symbol,
-                'price': round(float(latest_price), 2)
-            }
-            
-            for strategy_name in strategy_names:
-                strategy = get_strategy(strategy_name)
-                analyzed_df = strategy.analyze(df)
-                latest = analyzed_df.iloc[-1]
-                
-                signal = int(latest['signal'])
-                signal_text = 'buy' if signal == 1 else 'sell' if signal == -1 else 'hold'
-                
-                row[f'{strategy_name}_signal'] = signal_text
-                row[f'{strategy_name}_rsi'] = round(float(latest['rsi']), 1)
-                
-                if latest_rsi is None:
-                    latest_rsi = latest['rsi']
-            
-            row['rsi'] = round(float(latest_rsi), 1)
-            comparison_results.append(row)
+        first = latest[strategy_names[0]].loc[symbol]
+        row = {
+            'symbol': symbol,
+            'price': round(float(first['close']), 2)
+        }
+        
+        for strategy_name in strategy_names:
+            signal = int(latest[strategy_name].at[symbol, 'signal'])
+            signal_text = 'buy' if signal == 1 else 'sell' if signal == -1 else 'hold'
             
-        except Exception as e:
-            print(f"✗ {symbol} - Error: {e}")
-            continue
+            row[f'{strategy_name}_signal'] = signal_text
+            row[f'{strategy_name}_rsi'] = round(float(latest[strategy_name].at[symbol, 'rsi']), 1)
+        
+        row['rsi'] = round(float(first['rsi']), 1)
+        comparison_results.append(row)
     
     return pd.DataFrame(comparison_results)
 
@@ -266,14 +313,14 @@ def print_strategy_comparison(comparison_df: pd.DataFrame, strategy_names: List[
     print("🎯 STRATEGY DISAGREEMENTS (Most Interesting)")
     print("=" * 80)
     
-    disagreements = []
-    for _, row in comparison_df.iterrows():
-        signals = [row[f'{s}_signal'] for s in strategy_names]
-        if len(set(signals)) > 1:  # Not all the same
-            disagreements.append(row)
+    signal_cols = [f'{s}_signal' for s in strategy_names]
+    
+    # Rows where not all strategies give the same signal
+    disagree = comparison_df[signal_cols].nunique(axis=1) > 1
+    disagreements = comparison_df[disagree].head(15).to_dict('records')  # Top 15
     
     if disagreements:
-        for row in disagreements[:15]:  # Top 15
+        for row in disagreements:
             print(f"\n{row['symbol']:<6} ${row['price']:>8.2f}  RSI: {row['rsi']:>5.1f}")
             for strategy_name in strategy_names:
                 signal = row[f'{strategy_name}_signal']
@@ -311,7 +358,7 @@ def print_strategy_comparison(comparison_df: pd.DataFrame, strategy_names: List[
         
         if not buys.empty:
             print(f"\n{strategy_name.upper()} ({len(buys)} buys):")
-            for _, row in buys.head(10).iterrows():
+            for row in buys.head(10).to_dict('records'):
                 others = []
                 for other_strategy in strategy_names:
                     if other_strategy != strategy_name:
@@ -332,7 +379,7 @@ if __name__ == '__main__':
     print()
     
     # Create cache and fetch data
-    cache = DataCache()
+    cache = DataCache(downcast=True)
     
     test_symbols = ['AAPL', 'MSFT', 'NVDA', 'TSLA', 'AMD', 'META']
     
@@ -2,25 +2,60 @@
 Data fetching module for stock market data.
 Supports both yfinance (for backtesting) and Alpaca (for live trading).
 """
+import math
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
-from typing import Optional
-from config import Config
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+from config import get_config
+
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast OHLCV columns to compact dtypes.
+    
+    Prices become float32 and volume the smallest unsigned integer type
+    that holds it, roughly halving the frame's memory footprint.
+    
+    Args:
+        df: DataFrame with OHLCV data
+        
+    Returns:
+        DataFrame with downcast columns
+    """
+    dtypes = {col: 'float32' for col in PRICE_COLUMNS if col in df.columns}
+    df = df.astype(dtypes)
+    if 'volume' in df.columns and (df['volume'] >= 0).all():
+        df['volume'] = pd.to_numeric(df['volume'], downcast='unsigned')
+    return df
 
 
 class DataFetcher:
     """Fetches stock market data from various sources"""
     
-    def __init__(self, source: str = 'yfinance'):
+    def __init__(self, source: str = 'yfinance', cache_dir: Optional[str] = None,
+                 downcast: bool = False):
         """
         Initialize data fetcher.
         
         Args:
             source: 'yfinance' for historical data, 'alpaca' for live data
+            cache_dir: Directory for cached yfinance bars (defaults to config,
+                empty string disables the cache)
+            downcast: If True, return float32 prices and compact volume
+                (useful when holding many symbols at once)
         """
         self.source = source
-        self.config = Config()
+        self.downcast = downcast
+        self.config = get_config()
+        self.cache_dir = cache_dir if cache_dir is not None else self.config.DATA_CACHE_DIR
+        self._tickers: Dict[str, yf.Ticker] = {}
+        self._alpaca_api = None
     
     def fetch_data(self, symbol: str, period: Optional[int] = None) -> pd.DataFrame:
         """
@@ -46,68 +81,282 @@ class DataFetcher:
             raise ValueError(f"Period must be positive, got: {period}")
         
         if self.source == 'yfinance':
-            return self._fetch_yfinance(symbol, period)
+            df = self._fetch_yfinance(symbol, period)
         elif self.source == 'alpaca':
-            return self._fetch_alpaca(symbol, period)
+            df = self._fetch_alpaca(symbol, period)
         else:
             raise ValueError(f"Unknown data source: {self.source}")
+        
+        return downcast_ohlcv(df) if self.downcast else df
     
-    def _fetch_yfinance(self, symbol: str, period: int) -> pd.DataFrame:
-        """Fetch data using yfinance"""
+    def fetch_batch(self, symbols: List[str], period: Optional[int] = None,
+                    max_workers: int = 16) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical data for several symbols in a single request.
+        
+        Args:
+            symbols: List of stock ticker symbols
+            period: Number of days to look back (defaults to config)
+            max_workers: Maximum number of concurrent downloads (yfinance only)
+            
+        Returns:
+            Dictionary mapping each symbol to its OHLCV DataFrame.
+            Symbols with no data are omitted.
+            
+        Raises:
+            ValueError: If symbols or period are invalid
+        """
+        if not symbols:
+            raise ValueError("No symbols provided")
+        
+        if period is None:
+            period = self.config.LOOKBACK_DAYS
+        
+        if period <= 0:
+            raise ValueError(f"Period must be positive, got: {period}")
+        
+        if self.source == 'alpaca':
+            frames = self._fetch_alpaca_many(symbols, period)
+            return {
+                symbol: downcast_ohlcv(df) if self.downcast else df
+                for symbol, df in frames.items()
+            }
+        elif self.source != 'yfinance':
+            raise ValueError(f"Unknown data source: {self.source}")
+        
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period)
         
+        data = yf.download(
+            tickers=list(symbols),
+            start=start_date,
+            end=end_date,
+            interval=self._yfinance_interval(period),
+            group_by='ticker',
+            threads=min(max_workers, len(symbols)),
+            progress=False,
+            auto_adjust=True,
+            ignore_tz=False
+        )
+        
+        results = {}
+        if data is None or data.empty:
+            return results
+        
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                df = data[symbol]
+            else:
+                df = data
+            
+            df = df.dropna(how='all')
+            if df.empty:
+                continue
+            
+            df = df.copy()
+            df.columns = df.columns.str.lower().str.replace(' ', '_', regex=False)
+            df.columns.name = None
+            df.index.name = 'datetime'
+            results[symbol] = downcast_ohlcv(df) if self.downcast else df
+        
+        return results
+    
+    @staticmethod
+    def _yfinance_interval(period: int) -> str:
+        """Pick the finest yfinance interval available for the lookback period"""
         # Use daily intervals for longer periods (yfinance limitation)
         # 5m data only available for ~7 days, 1h for ~730 days, 1d for years
         if period > 7:
-            interval = '1d'
+            return '1d'
+        return '1h'  # Use 1h instead of 5m for better reliability
+    
+    def _fetch_yfinance(self, symbol: str, period: int) -> pd.DataFrame:
+        """Fetch data using yfinance"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=period)
+        interval = self._yfinance_interval(period)
+        
+        if self.cache_dir:
+            df = self._load_or_fetch(symbol, start_date, end_date, interval)
         else:
-            interval = '1h'  # Use 1h instead of 5m for better reliability
+            df = self._since(self._download_history(symbol, start_date, end_date, interval),
+                             start_date)
+        
+        if df.empty:
+            raise ValueError(f"No data found for symbol: {symbol}")
         
-        ticker = yf.Ticker(symbol)
+        return df
+    
+    @staticmethod
+    def _since(df: pd.DataFrame, start_date: datetime) -> pd.DataFrame:
+        """Bars at or after start_date, read in the index's (exchange) timezone"""
+        if df.empty:
+            return df
+        start = pd.Timestamp(start_date)
+        if df.index.tz is not None:
+            start = start.tz_localize(df.index.tz)
+        return df[df.index >= start]
+    
+    def _download_history(self, symbol: str, start_date: datetime, end_date: datetime,
+                          interval: str) -> pd.DataFrame:
+        """Download bars from yfinance and standardize column names"""
+        ticker = self._get_ticker(symbol)
         df = ticker.history(start=start_date, end=end_date, interval=interval)
         
         if df.empty:
-            raise ValueError(f"No data found for symbol: {symbol}")
+            return df
         
         # Clean and standardize column names
-        df.columns = [col.lower().replace(' ', '_') for col in df.columns]
+        df.columns = df.columns.str.lower().str.replace(' ', '_', regex=False)
         df.index.name = 'datetime'
         
         return df
     
-    def _fetch_alpaca(self, symbol: str, period: int) -> pd.DataFrame:
-        """Fetch data using Alpaca API (for live trading)"""
-        try:
-            import alpaca_trade_api as tradeapi
+    def _load_or_fetch(self, symbol: str, start_date: datetime, end_date: datetime,
+                       interval: str) -> pd.DataFrame:
+        """
+        Fetch bars through the on-disk cache.
+        
+        Complete days already on disk are reused and only the missing tail is
+        downloaded. The exchange's current day is never persisted since its
+        bars are still changing.
+        
+        yfinance prices are adjusted for splits and dividends, so the tail is
+        downloaded from the last cached bar onwards and the whole range is
+        refetched if that bar's close has changed since it was cached.
+        """
+        cache_file = Path(self.cache_dir) / interval / f"{symbol}.pkl"
+        first_day = start_date.date()
+        
+        cached = None
+        if cache_file.exists():
+            try:
+                cached = pd.read_pickle(cache_file)
+            except Exception:
+                cached = None  # Corrupt or incompatible cache file, refetch
+        
+        # Reuse the cache only if it covers the requested start without gaps
+        if (cached is not None and not cached['data'].empty and cached['start'] <= first_day
+                and cached['end'] >= first_day - timedelta(days=1)):
+            coverage_start = cached['start']
+            fetch_start = datetime.combine(cached['data'].index[-1].date(), datetime.min.time())
+            frames = [cached['data']]
+        else:
+            coverage_start = first_day
+            fetch_start = start_date
+            frames = []
+        
+        fetched = self._download_history(symbol, fetch_start, end_date, interval)
+        if frames and not self._same_adjustment(cached['data'], fetched):
+            # A split or dividend re-adjusted the history since it was cached
+            coverage_start = first_day
+            frames = []
+            fetched = self._download_history(symbol, start_date, end_date, interval)
+        frames = [frame for frame in frames + [fetched] if not frame.empty]
+        if not frames:
+            return fetched
+        
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        
+        # Bar dates are in the exchange's timezone, so "today" must be too;
+        # the local date can already be a day ahead of a session still trading
+        last_complete_day = (pd.Timestamp.now(tz=df.index.tz).normalize()
+                             - pd.Timedelta(days=1)).date()
+        row_days = df.index.date
+        if last_complete_day >= coverage_start:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            pd.to_pickle({
+                'start': coverage_start,
+                'end': last_complete_day,
+                'data': df[row_days <= last_complete_day]
+            }, cache_file)
+        
+        return self._since(df, start_date)
+    
+    @staticmethod
+    def _same_adjustment(cached: pd.DataFrame, fetched: pd.DataFrame) -> bool:
+        """Whether the refetched copy of the last cached bar still has its cached close"""
+        last_bar = cached.index[-1]
+        if last_bar not in fetched.index:
+            return False
+        return math.isclose(fetched.at[last_bar, 'close'], cached['close'].iloc[-1], rel_tol=1e-6)
+    
+    def _get_ticker(self, symbol: str) -> yf.Ticker:
+        """Get a yfinance Ticker, reusing the one built for earlier calls"""
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            ticker = self._tickers[symbol] = yf.Ticker(symbol)
+        return ticker
+    
+    def _get_alpaca_api(self):
+        """Get the Alpaca REST client, creating it on first use"""
+        if self._alpaca_api is None:
+            try:
+                import alpaca_trade_api as tradeapi
+            except ImportError:
+                raise ImportError("alpaca-trade-api not installed. Install with: pip install alpaca-trade-api")
             
-            api = tradeapi.REST(
+            self._alpaca_api = tradeapi.REST(
                 self.config.ALPACA_API_KEY,
                 self.config.ALPACA_SECRET_KEY,
                 self.config.ALPACA_BASE_URL
             )
-            
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=period)
-            
-            bars = api.get_bars(
-                symbol,
-                self.config.DATA_TIMEFRAME,
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ).df
-            
-            if bars.empty:
-                raise ValueError(f"No data found for symbol: {symbol}")
-            
-            # Standardize column names
-            bars.columns = [col.lower() for col in bars.columns]
-            bars.index.name = 'datetime'
-            
-            return bars
-            
-        except ImportError:
-            raise ImportError("alpaca-trade-api not installed. Install with: pip install alpaca-trade-api")
+        return self._alpaca_api
+    
+    def _fetch_alpaca(self, symbol: str, period: int) -> pd.DataFrame:
+        """Fetch data using Alpaca API (for live trading)"""
+        api = self._get_alpaca_api()
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=period)
+        
+        bars = api.get_bars(
+            symbol,
+            self.config.DATA_TIMEFRAME,
+            start=start_date.isoformat(),
+            end=end_date.isoformat()
+        ).df
+        
+        if bars.empty:
+            raise ValueError(f"No data found for symbol: {symbol}")
+        
+        # Standardize column names
+        bars.columns = bars.columns.str.lower()
+        bars.index.name = 'datetime'
+        
+        return bars
+    
+    def _fetch_alpaca_many(self, symbols: List[str], period: int) -> Dict[str, pd.DataFrame]:
+        """Fetch bars for several symbols with one Alpaca request"""
+        api = self._get_alpaca_api()
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=period)
+        
+        bars = api.get_bars(
+            list(symbols),
+            self.config.DATA_TIMEFRAME,
+            start=start_date.isoformat(),
+            end=end_date.isoformat()
+        ).df
+        
+        results = {}
+        if bars.empty:
+            return results
+        
+        # Standardize column names; multi-symbol bars carry a 'symbol' column
+        bars.columns = bars.columns.str.lower()
+        bars.index.name = 'datetime'
+        grouped = dict(list(bars.groupby('symbol', sort=False)))
+        
+        for symbol in symbols:
+            if symbol in grouped:
+                results[symbol] = grouped[symbol].drop(columns='symbol')
+        
+        return results
     
     def get_current_price(self, symbol: str) -> float:
         """
@@ -123,23 +372,35 @@ class DataFetcher:
             ValueError: If price cannot be fetched
         """
         if self.source == 'yfinance':
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='1d', interval='1m')
+            # Today's daily bar closes at the latest trade, so one row is enough
+            ticker = self._get_ticker(symbol)
+            data = ticker.history(period='1d', interval='1d')
             if not data.empty:
                 return float(data['Close'].iloc[-1])
             raise ValueError(f"Could not fetch current price for {symbol}")
         elif self.source == 'alpaca':
             try:
-                import alpaca_trade_api as tradeapi
-                api = tradeapi.REST(
-                    self.config.ALPACA_API_KEY,
-                    self.config.ALPACA_SECRET_KEY,
-                    self.config.ALPACA_BASE_URL
-                )
-                quote = api.get_latest_quote(symbol)
+                quote = self._get_alpaca_api().get_latest_quote(symbol)
                 return float(quote.bp)  # Use bid price
             except Exception as e:
                 raise ValueError(f"Could not fetch current price for {symbol}: {e}")
         else:
             raise ValueError(f"Unknown data source: {self.source}")
 
+
+@lru_cache(maxsize=None)
+def get_default_fetcher(source: str = 'yfinance', downcast: bool = False) -> DataFetcher:
+    """
+    Get a shared DataFetcher for the given options.
+    
+    Reusing one fetcher keeps its Ticker objects and API client alive across
+    calls, e.g. when the interactive menu runs several scripts in a row.
+    
+    Args:
+        source: 'yfinance' for historical data, 'alpaca' for live data
+        downcast: If True, return float32 prices and compact volume
+        
+    Returns:
+        Shared DataFetcher instance
+    """
+    return DataFetcher(source=source, downcast=downcast)
@@ -1,19 +1,55 @@
 """Type stubs for data_fetcher module"""
 import pandas as pd
-from typing import Optional
+import yfinance as yf
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from config import Config
 
+PRICE_COLUMNS: List[str]
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame: ...
+
 class DataFetcher:
     source: str
+    downcast: bool
     config: Config
+    cache_dir: str
+    _tickers: Dict[str, yf.Ticker]
+    _alpaca_api: Optional[Any]
     
-    def __init__(self, source: str = 'yfinance') -> None: ...
+    def __init__(self, source: str = 'yfinance', cache_dir: Optional[str] = None,
+                 downcast: bool = False) -> None: ...
     
     def fetch_data(self, symbol: str, period: Optional[int] = None) -> pd.DataFrame: ...
     
+    def fetch_batch(self, symbols: List[str], period: Optional[int] = None,
+                    max_workers: int = 16) -> Dict[str, pd.DataFrame]: ...
+    
+    @staticmethod
+    def _yfinance_interval(period: int) -> str: ...
+    
     def _fetch_yfinance(self, symbol: str, period: int) -> pd.DataFrame: ...
     
+    @staticmethod
+    def _since(df: pd.DataFrame, start_date: datetime) -> pd.DataFrame: ...
+    
+    def _download_history(self, symbol: str, start_date: datetime, end_date: datetime,
+                          interval: str) -> pd.DataFrame: ...
+    
+    def _load_or_fetch(self, symbol: str, start_date: datetime, end_date: datetime,
+                       interval: str) -> pd.DataFrame: ...
+    
+    @staticmethod
+    def _same_adjustment(cached: pd.DataFrame, fetched: pd.DataFrame) -> bool: ...
+    
+    def _get_ticker(self, symbol: str) -> yf.Ticker: ...
+    
+    def _get_alpaca_api(self) -> Any: ...
+    
     def _fetch_alpaca(self, symbol: str, period: int) -> pd.DataFrame: ...
     
+    def _fetch_alpaca_many(self, symbols: List[str], period: int) -> Dict[str, pd.DataFrame]: ...
+    
     def get_current_price(self, symbol: str) -> float: ...
 
+def get_default_fetcher(source: str = 'yfinance', downcast: bool = False) -> DataFetcher: ...
@@ -0,0 +1,26 @@
+"""
+Technical indicators shared by the trading strategies.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Union
+
+
+def rsi(close: Union[pd.Series, pd.DataFrame], window: int) -> Union[pd.Series, pd.DataFrame]:
+    """Wilder RSI of a series (or every column at once), matching ta's RSIIndicator"""
+    diff = close.diff(1)
+    up_direction = diff.where(diff > 0, 0.0)
+    down_direction = -diff.where(diff < 0, 0.0)
+    emaup = up_direction.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    emadn = down_direction.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    rsi = 100 - (100 / (1 + emaup / emadn))
+    return rsi.where(emadn != 0, 100)
+
+
+def previous(values: np.ndarray) -> np.ndarray:
+    """Each bar's preceding value (NaN on the first bar), like Series.shift(1)"""
+    prev = np.empty_like(values)
+    prev[:1] = np.nan
+    prev[1:] = values[:-1]
+    return prev
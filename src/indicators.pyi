@@ -0,0 +1,8 @@
+"""Type stubs for indicators module"""
+import numpy as np
+import pandas as pd
+from typing import Union
+
+def rsi(close: Union[pd.Series, pd.DataFrame], window: int) -> Union[pd.Series, pd.DataFrame]: ...
+
+def previous(values: np.ndarray) -> np.ndarray: ...
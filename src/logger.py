@@ -2,8 +2,11 @@
 Structured logging configuration for the trading system.
 Provides consistent logging across all modules.
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -15,8 +18,9 @@ class TradingLogger:
     Supports both file and console output with structured formatting.
     """
     
-    _loggers = {}
     _configured = False
+    _listener: Optional[QueueListener] = None
+    _queue_handler: Optional[QueueHandler] = None
     
     @classmethod
     def setup(cls, log_level: str = "INFO", log_dir: Optional[str] = None):
@@ -40,6 +44,10 @@ class TradingLogger:
         else:
             log_file = None
         
+        # Stop the file writer from any earlier setup before its queue
+        # handler goes, so no record is left on an unread queue
+        cls.shutdown()
+        
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -64,15 +72,35 @@ class TradingLogger:
         console_handler.setFormatter(simple_formatter)
         root_logger.addHandler(console_handler)
         
-        # File handler (more detailed)
+        # File handler (more detailed), written from a background thread so
+        # logging calls never wait on disk I/O
         if log_file:
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
-            root_logger.addHandler(file_handler)
+            
+            log_queue = queue.Queue(-1)
+            cls._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            cls._listener.start()
+            cls._queue_handler = QueueHandler(log_queue)
+            root_logger.addHandler(cls._queue_handler)
         
         cls._configured = True
     
+    @classmethod
+    def shutdown(cls):
+        """Write out queued file log records and stop the background writer"""
+        # Detach the queue first so later records are not left unread
+        if cls._queue_handler is not None:
+            logging.getLogger().removeHandler(cls._queue_handler)
+            cls._queue_handler = None
+        
+        if cls._listener is not None:
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.close()
+            cls._listener = None
+    
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """
@@ -87,10 +115,12 @@ class TradingLogger:
         if not cls._configured:
             cls.setup()
         
-        if name not in cls._loggers:
-            cls._loggers[name] = logging.getLogger(name)
-        
-        return cls._loggers[name]
+        # logging keeps one logger per name, so no cache is needed here
+        return logging.getLogger(name)
+
+
+# Flush queued file records before the interpreter exits
+atexit.register(TradingLogger.shutdown)
 
 
 def get_logger(name: str) -> logging.Logger:
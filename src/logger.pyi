@@ -1,14 +1,19 @@
 """Type stubs for logger module"""
 import logging
-from typing import Optional, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 class TradingLogger:
-    _loggers: Dict[str, logging.Logger]
     _configured: bool
+    _listener: Optional[QueueListener]
+    _queue_handler: Optional[QueueHandler]
     
     @classmethod
     def setup(cls, log_level: str = "INFO", log_dir: Optional[str] = None) -> None: ...
     
+    @classmethod
+    def shutdown(cls) -> None: ...
+    
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger: ...
 
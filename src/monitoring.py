@@ -2,14 +2,23 @@
 Monitoring and metrics tracking for the trading system.
 Tracks errors, performance, and trading activity.
 """
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
-import json
+from collections import defaultdict, deque
+from functools import partial
+import orjson
+import threading
+import time
 from pathlib import Path
 
 
+def _ns_to_iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
 @dataclass
 class MetricSnapshot:
     """Snapshot of metrics at a point in time"""
@@ -22,19 +31,86 @@ class MetricSnapshot:
     avg_response_time_ms: float
 
 
+class TimingBuffer:
+    """
+    Fixed-size ring buffer holding the most recent timings of one operation.
+    
+    A running sum is kept alongside the buffer so the mean is O(1), and
+    memory stays capped however long the process runs.
+    """
+    
+    def __init__(self, capacity: int = 10_000):
+        """
+        Initialize an empty buffer.
+        
+        Args:
+            capacity: Number of most recent timings to keep
+        """
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+        self._sum = 0.0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, value: float):
+        """Add a timing, evicting the oldest one once the buffer is full"""
+        if self._count == len(self._values):
+            self._sum -= self._values[self._next]
+        else:
+            self._count += 1
+        self._values[self._next] = value
+        self._sum += value
+        self._next = (self._next + 1) % len(self._values)
+    
+    def values(self) -> np.ndarray:
+        """Timings currently held, not in insertion order"""
+        return self._values[:self._count]
+    
+    def mean(self) -> float:
+        """Mean of the timings currently held"""
+        return self._sum / self._count if self._count else 0.0
+    
+    def percentiles(self) -> Tuple[float, float]:
+        """
+        Get the median and 99th percentile without a full sort.
+        
+        Returns:
+            Tuple of (p50, p99), or (0.0, 0.0) when empty
+        """
+        if not self._count:
+            return 0.0, 0.0
+        ranks = [self._count // 2, self._count * 99 // 100]
+        p50, p99 = np.partition(self.values(), ranks)[ranks]
+        return float(p50), float(p99)
+
+
 class MonitoringSystem:
     """
     Central monitoring system for tracking application health and metrics.
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access: updates and reads go through a
+    single lock, since ``+=`` on a dict entry is not atomic across threads.
+    The lock is reentrant so summaries can reuse the single-value getters.
+    
+    Error and warning entries keep their timestamp as integer nanoseconds
+    since the epoch (``time.time_ns()``), and only the most recent
+    ``MAX_EVENTS`` entries per category are kept. The per-category counters
+    in ``metrics`` still count every occurrence. ``get_errors`` and
+    ``get_warnings`` return the entries with ISO 8601 timestamps.
     """
     
+    MAX_EVENTS = 10_000
+    
     def __init__(self):
         """Initialize monitoring system"""
-        self.errors: Dict[str, List[Dict]] = defaultdict(list)
-        self.warnings: Dict[str, List[Dict]] = defaultdict(list)
+        events = partial(deque, maxlen=self.MAX_EVENTS)
+        self.errors: Dict[str, Deque[Dict]] = defaultdict(events)
+        self.warnings: Dict[str, Deque[Dict]] = defaultdict(events)
         self.metrics: Dict[str, int] = defaultdict(int)
-        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.timings: Dict[str, TimingBuffer] = defaultdict(TimingBuffer)
         self.start_time = datetime.now()
+        self._lock = threading.RLock()
     
     def record_error(self, category: str, error: Exception, context: Optional[Dict] = None):
         """
@@ -46,14 +122,15 @@ class MonitoringSystem:
             context: Additional context information
         """
         error_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time_ns(),
             'error_type': type(error).__name__,
             'message': str(error),
             'context': context or {}
         }
-        self.errors[category].append(error_entry)
-        self.metrics[f'errors_{category}'] += 1
-        self.metrics['total_errors'] += 1
+        with self._lock:
+            self.errors[category].append(error_entry)
+            self.metrics[f'errors_{category}'] += 1
+            self.metrics['total_errors'] += 1
     
     def record_warning(self, category: str, message: str, context: Optional[Dict] = None):
         """
@@ -65,13 +142,14 @@ class MonitoringSystem:
             context: Additional context
         """
         warning_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time_ns(),
             'message': message,
             'context': context or {}
         }
-        self.warnings[category].append(warning_entry)
-        self.metrics[f'warnings_{category}'] += 1
-        self.metrics['total_warnings'] += 1
+        with self._lock:
+            self.warnings[category].append(warning_entry)
+            self.metrics[f'warnings_{category}'] += 1
+            self.metrics['total_warnings'] += 1
     
     def record_metric(self, name: str, value: int = 1):
         """
@@ -81,7 +159,8 @@ class MonitoringSystem:
             name: Metric name
             value: Value to add (default 1)
         """
-        self.metrics[name] += value
+        with self._lock:
+            self.metrics[name] += value
     
     def record_timing(self, operation: str, duration_ms: float):
         """
@@ -91,8 +170,43 @@ class MonitoringSystem:
             operation: Operation name
             duration_ms: Duration in milliseconds
         """
-        self.timings[operation].append(duration_ms)
-        self.metrics[f'{operation}_count'] += 1
+        with self._lock:
+            self.timings[operation].append(duration_ms)
+            self.metrics[f'{operation}_count'] += 1
+    
+    def get_errors(self, category: Optional[str] = None) -> List[Dict]:
+        """
+        Get recorded errors with readable timestamps.
+        
+        Args:
+            category: Specific category or None for all, oldest first per category
+            
+        Returns:
+            Copies of the error entries with 'timestamp' as an ISO 8601 string
+        """
+        return self._readable_entries(self.errors, category)
+    
+    def get_warnings(self, category: Optional[str] = None) -> List[Dict]:
+        """
+        Get recorded warnings with readable timestamps.
+        
+        Args:
+            category: Specific category or None for all, oldest first per category
+            
+        Returns:
+            Copies of the warning entries with 'timestamp' as an ISO 8601 string
+        """
+        return self._readable_entries(self.warnings, category)
+    
+    def _readable_entries(self, events: Dict[str, Deque[Dict]],
+                          category: Optional[str]) -> List[Dict]:
+        """Copy entries out under the lock, formatting their timestamps"""
+        with self._lock:
+            if category is None:
+                entries = [entry for entries in events.values() for entry in entries]
+            else:
+                entries = list(events.get(category, ()))
+        return [{**entry, 'timestamp': _ns_to_iso(entry['timestamp'])} for entry in entries]
     
     def get_error_rate(self, category: Optional[str] = None) -> float:
         """
@@ -104,15 +218,16 @@ class MonitoringSystem:
         Returns:
             Errors per minute
         """
-        runtime_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+        with self._lock:
+            runtime_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+            if category:
+                error_count = self.metrics.get(f'errors_{category}', 0)
+            else:
+                error_count = self.metrics.get('total_errors', 0)
+        
         if runtime_minutes < 0.01:  # Avoid division by zero
             runtime_minutes = 0.01
         
-        if category:
-            error_count = self.metrics.get(f'errors_{category}', 0)
-        else:
-            error_count = self.metrics.get('total_errors', 0)
-        
         return error_count / runtime_minutes
     
     def get_avg_timing(self, operation: str) -> float:
@@ -125,20 +240,22 @@ class MonitoringSystem:
         Returns:
             Average duration in milliseconds
         """
-        timings = self.timings.get(operation, [])
-        return sum(timings) / len(timings) if timings else 0.0
+        with self._lock:
+            timings = self.timings.get(operation)
+            return timings.mean() if timings is not None else 0.0
     
     def get_snapshot(self) -> MetricSnapshot:
         """Get current metrics snapshot"""
-        return MetricSnapshot(
-            timestamp=datetime.now(),
-            errors_count=self.metrics.get('total_errors', 0),
-            warnings_count=self.metrics.get('total_warnings', 0),
-            trades_executed=self.metrics.get('trades_executed', 0),
-            signals_generated=self.metrics.get('signals_generated', 0),
-            api_calls=self.metrics.get('api_calls', 0),
-            avg_response_time_ms=self.get_avg_timing('api_call')
-        )
+        with self._lock:
+            return MetricSnapshot(
+                timestamp=datetime.now(),
+                errors_count=self.metrics.get('total_errors', 0),
+                warnings_count=self.metrics.get('total_warnings', 0),
+                trades_executed=self.metrics.get('trades_executed', 0),
+                signals_generated=self.metrics.get('signals_generated', 0),
+                api_calls=self.metrics.get('api_calls', 0),
+                avg_response_time_ms=self.get_avg_timing('api_call')
+            )
     
     def get_summary(self) -> Dict:
         """
@@ -149,27 +266,42 @@ class MonitoringSystem:
         """
         runtime = (datetime.now() - self.start_time).total_seconds()
         
-        return {
-            'uptime_seconds': runtime,
-            'errors': {
-                'total': self.metrics.get('total_errors', 0),
-                'by_category': {k: len(v) for k, v in self.errors.items()},
-                'rate_per_minute': self.get_error_rate()
-            },
-            'warnings': {
-                'total': self.metrics.get('total_warnings', 0),
-                'by_category': {k: len(v) for k, v in self.warnings.items()}
-            },
-            'metrics': dict(self.metrics),
-            'timings': {
-                op: {
-                    'count': len(times),
-                    'avg_ms': sum(times) / len(times) if times else 0,
-                    'min_ms': min(times) if times else 0,
-                    'max_ms': max(times) if times else 0
+        with self._lock:
+            return {
+                'uptime_seconds': runtime,
+                'errors': {
+                    'total': self.metrics.get('total_errors', 0),
+                    'by_category': {k: self.metrics[f'errors_{k}'] for k in self.errors},
+                    'last_seen': {k: _ns_to_iso(v[-1]['timestamp']) for k, v in self.errors.items() if v},
+                    'rate_per_minute': self.get_error_rate()
+                },
+                'warnings': {
+                    'total': self.metrics.get('total_warnings', 0),
+                    'by_category': {k: self.metrics[f'warnings_{k}'] for k in self.warnings},
+                    'last_seen': {k: _ns_to_iso(v[-1]['timestamp']) for k, v in self.warnings.items() if v}
+                },
+                'metrics': dict(self.metrics),
+                'timings': {
+                    op: self._timing_stats(times)
+                    for op, times in self.timings.items()
                 }
-                for op, times in self.timings.items()
             }
+    
+    @staticmethod
+    def _timing_stats(times: TimingBuffer) -> Dict:
+        """Summarize the timings held for one operation"""
+        if not len(times):
+            return {'count': 0, 'avg_ms': 0, 'min_ms': 0, 'max_ms': 0, 'p50_ms': 0, 'p99_ms': 0}
+        
+        values = times.values()
+        p50, p99 = times.percentiles()
+        return {
+            'count': len(times),
+            'avg_ms': times.mean(),
+            'min_ms': float(values.min()),
+            'max_ms': float(values.max()),
+            'p50_ms': p50,
+            'p99_ms': p99
         }
     
     def save_report(self, filepath: str):
@@ -180,18 +312,23 @@ class MonitoringSystem:
             filepath: Path to save report
         """
         report = self.get_summary()
-        report['timestamp'] = datetime.now().isoformat()
+        # orjson writes datetimes as ISO 8601, same as isoformat()
+        report['timestamp'] = datetime.now()
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                report,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+            ))
     
     def reset(self):
         """Reset all metrics and errors"""
-        self.errors.clear()
-        self.warnings.clear()
-        self.metrics.clear()
-        self.timings.clear()
-        self.start_time = datetime.now()
+        with self._lock:
+            self.errors.clear()
+            self.warnings.clear()
+            self.metrics.clear()
+            self.timings.clear()
+            self.start_time = datetime.now()
 
 
 # Global monitoring instance
@@ -1,8 +1,11 @@
 """Type stubs for monitoring module"""
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+def _ns_to_iso(ns: int) -> str: ...
+
 @dataclass
 class MetricSnapshot:
     timestamp: datetime
@@ -13,11 +16,25 @@ class MetricSnapshot:
     api_calls: int
     avg_response_time_ms: float
 
+class TimingBuffer:
+    def __init__(self, capacity: int = 10_000) -> None: ...
+    
+    def __len__(self) -> int: ...
+    
+    def append(self, value: float) -> None: ...
+    
+    def values(self) -> np.ndarray: ...
+    
+    def mean(self) -> float: ...
+    
+    def percentiles(self) -> Tuple[float, float]: ...
+
 class MonitoringSystem:
-    errors: Dict[str, List[Dict]]
-    warnings: Dict[str, List[Dict]]
+    MAX_EVENTS: int
+    errors: Dict[str, Deque[Dict]]
+    warnings: Dict[str, Deque[Dict]]
     metrics: Dict[str, int]
-    timings: Dict[str, List[float]]
+    timings: Dict[str, TimingBuffer]
     start_time: datetime
     
     def __init__(self) -> None: ...
@@ -30,6 +47,13 @@ class MonitoringSystem:
     
     def record_timing(self, operation: str, duration_ms: float) -> None: ...
     
+    def get_errors(self, category: Optional[str] = None) -> List[Dict]: ...
+    
+    def get_warnings(self, category: Optional[str] = None) -> List[Dict]: ...
+    
+    def _readable_entries(self, events: Dict[str, Deque[Dict]],
+                          category: Optional[str]) -> List[Dict]: ...
+    
     def get_error_rate(self, category: Optional[str] = None) -> float: ...
     
     def get_avg_timing(self, operation: str) -> float: ...
@@ -38,6 +62,9 @@ class MonitoringSystem:
     
     def get_summary(self) -> Dict: ...
     
+    @staticmethod
+    def _timing_stats(times: TimingBuffer) -> Dict: ...
+    
     def save_report(self, filepath: str) -> None: ...
     
     def reset(self) -> None: ...
@@ -7,27 +7,45 @@ Strategies:
 - Aggressive: More trades, looser conditions, higher risk
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Any
-from ta.momentum import RSIIndicator
-from ta.trend import SMAIndicator
-from config import Config
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+from config import Config, get_config
+import indicators
+
+
+# Columns reported for the latest bar by StrategyProfile.analyze_tail
+LATEST_COLUMNS = ['signal', 'close', 'rsi', 'fast_ma', 'slow_ma']
+
+
+def _prev_row(frame: pd.DataFrame) -> pd.Series:
+    """Second-to-last row, i.e. shift(1).iloc[-1] without shifting the whole frame"""
+    if len(frame) > 1:
+        return frame.iloc[-2]
+    return pd.Series(np.nan, index=frame.columns)
 
 
 class StrategyProfile:
     """Base class for strategy profiles"""
     
+    __slots__ = ('config', '_stop_loss', '_take_profit')
+    
     NAME = "Base"
     DESCRIPTION = "Base strategy"
     
     # Override these in subclasses
+    RSI_PERIOD = 14
     RSI_OVERSOLD = 30
     RSI_OVERBOUGHT = 70
     FAST_MA_PERIOD = 10
     SLOW_MA_PERIOD = 50
     
     def __init__(self, config: Optional[Config] = None):
-        self.config = config or Config()
+        self.config = config or get_config()
+        # Exit thresholds are checked on every live tick; read them once
+        self._stop_loss = self.config.STOP_LOSS_PCT
+        self._take_profit = self.config.TAKE_PROFIT_PCT
     
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate technical indicators"""
@@ -39,21 +57,18 @@ class StrategyProfile:
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
-        df = df.copy()
+        # Only whole columns are added, so a shallow copy keeps the caller's
+        # frame intact without duplicating its data
+        df = df.copy(deep=False)
+        
+        close = df['close']
         
         # RSI
-        rsi_indicator = RSIIndicator(close=df['close'], window=14)
-        df['rsi'] = rsi_indicator.rsi()
-        df['rsi_prev'] = df['rsi'].shift(1)
+        df['rsi'] = indicators.rsi(close, self.RSI_PERIOD)
         
         # Moving Averages
-        fast_ma = SMAIndicator(close=df['close'], window=self.FAST_MA_PERIOD)
-        slow_ma = SMAIndicator(close=df['close'], window=self.SLOW_MA_PERIOD)
-        
-        df['fast_ma'] = fast_ma.sma_indicator()
-        df['slow_ma'] = slow_ma.sma_indicator()
-        df['fast_ma_prev'] = df['fast_ma'].shift(1)
-        df['slow_ma_prev'] = df['slow_ma'].shift(1)
+        df['fast_ma'] = close.rolling(window=self.FAST_MA_PERIOD).mean()
+        df['slow_ma'] = close.rolling(window=self.SLOW_MA_PERIOD).mean()
         
         return df
     
@@ -61,12 +76,112 @@ class StrategyProfile:
         """Generate buy/sell signals - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement generate_signals")
     
+    @staticmethod
+    def _indicator_arrays(df: pd.DataFrame) -> List[np.ndarray]:
+        """
+        Raw arrays of rsi, rsi_prev, fast_ma, slow_ma, fast_ma_prev, slow_ma_prev and close.
+        
+        The previous values are each row's preceding row, so the first row of
+        df never signals a crossover.
+        """
+        rsi, fast_ma, slow_ma, close = (df[col].to_numpy() for col in ('rsi', 'fast_ma', 'slow_ma', 'close'))
+        return [rsi, indicators.previous(rsi), fast_ma, slow_ma,
+                indicators.previous(fast_ma), indicators.previous(slow_ma), close]
+    
+    @staticmethod
+    def _combine_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+        """1 on buy, -1 on sell (sell wins when both hold), 0 otherwise"""
+        return np.where(sell, -1, np.where(buy, 1, 0))
+    
     def analyze(self, df: pd.DataFrame) -> pd.DataFrame:
         """Complete analysis: calculate indicators and generate signals"""
         df = self.calculate_indicators(df)
         df = self.generate_signals(df)
         return df
     
+    def analyze_tail(self, df: pd.DataFrame,
+                     volume_window: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze only the latest bar.
+        
+        Indicators still need the full history, but the signal rules run on
+        the last two rows alone (the latest bar and the one its crossovers
+        compare against), for callers that only want the current signal.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            volume_window: If set, also report the average volume over this
+                many most recent bars as 'avg_volume'
+            
+        Returns:
+            Dictionary with the latest signal, close, rsi, fast_ma and slow_ma
+        """
+        df = self.calculate_indicators(df)
+        latest = self.generate_signals(df.iloc[-2:])
+        result = dict(zip(LATEST_COLUMNS, latest[LATEST_COLUMNS].to_numpy(dtype=float)[-1]))
+        
+        if volume_window is not None:
+            result['avg_volume'] = float(df['volume'].tail(volume_window).mean())
+        
+        return result
+    
+    def analyze_batch(self, frames: Dict[str, pd.DataFrame],
+                      shared: Optional[Dict[Any, pd.DataFrame]] = None) -> pd.DataFrame:
+        """
+        Analyze the latest bar of many symbols at once.
+        
+        Symbols with the same number of bars are laid side by side so each
+        indicator is computed for the whole group in one pass, and the signal
+        rules then run once over every symbol's previous and latest rows,
+        stacked in adjacent pairs.
+        
+        Args:
+            frames: Dictionary mapping symbols to OHLCV DataFrames
+            shared: Optional dictionary reused when several strategies analyze
+                the same frames, so indicators they have in common (such as
+                RSI) are only computed once
+            
+        Returns:
+            DataFrame indexed by symbol with the latest signal, close, rsi,
+            fast_ma and slow_ma. Symbols whose data is empty or missing
+            price columns are left out.
+        """
+        groups: Dict[int, List[str]] = {}
+        for symbol, df in frames.items():
+            if not df.empty and {'close', 'high', 'low'}.issubset(df.columns):
+                groups.setdefault(len(df), []).append(symbol)
+        
+        if shared is None:
+            shared = {}
+        
+        pairs = []
+        for length, group in groups.items():
+            close = shared.get(('close', length))
+            if close is None:
+                close = pd.DataFrame({symbol: frames[symbol]['close'].to_numpy() for symbol in group})
+                shared[('close', length)] = close
+            
+            rsi = shared.get(('rsi', length, self.RSI_PERIOD))
+            if rsi is None:
+                rsi = indicators.rsi(close, self.RSI_PERIOD)
+                shared[('rsi', length, self.RSI_PERIOD)] = rsi
+            
+            fast_ma = close.rolling(window=self.FAST_MA_PERIOD).mean()
+            slow_ma = close.rolling(window=self.SLOW_MA_PERIOD).mean()
+            
+            columns = {'close': close, 'rsi': rsi, 'fast_ma': fast_ma, 'slow_ma': slow_ma}
+            previous = pd.DataFrame({col: _prev_row(frame) for col, frame in columns.items()})
+            latest = pd.DataFrame({col: frame.iloc[-1] for col, frame in columns.items()})
+            # A stable sort on symbol puts each previous row right before its latest row
+            pairs.append(pd.concat([previous, latest]).sort_index(kind='stable'))
+        
+        if not pairs:
+            return pd.DataFrame(columns=LATEST_COLUMNS, dtype=float)
+        
+        signals = self.generate_signals(pd.concat(pairs)).iloc[1::2]
+        order = [symbol for symbol in frames if symbol in signals.index]
+        return signals.loc[order, LATEST_COLUMNS].astype(float)
+    
     def get_current_signal(self, df: pd.DataFrame, 
                           position: Optional[Dict] = None) -> Dict[str, Any]:
         """Get current trading signal with position context"""
@@ -78,20 +193,21 @@ class StrategyProfile:
         if missing_cols:
             return {'action': 'hold', 'reason': f'Missing columns: {missing_cols}'}
         
-        latest = df.iloc[-1]
-        current_signal = int(latest['signal'])
+        # Read the last bar from the column arrays instead of building a row Series
+        current_signal = int(df['signal'].to_numpy()[-1])
+        current_price = float(df['close'].to_numpy()[-1])
+        current_rsi = float(df['rsi'].to_numpy()[-1])
         
         # Check position-based exits
         if position:
             entry_price = position.get('entry_price')
             quantity = position.get('quantity', 0)
-            current_price = latest['close']
             
             if quantity > 0 and entry_price:
                 pnl_pct = (current_price - entry_price) / entry_price
                 
                 # Stop loss
-                if pnl_pct <= -self.config.STOP_LOSS:
+                if pnl_pct <= -self._stop_loss:
                     return {
                         'action': 'sell',
                         'reason': f'Stop loss triggered ({pnl_pct:.2%})',
@@ -99,7 +215,7 @@ class StrategyProfile:
                     }
                 
                 # Take profit
-                if pnl_pct >= self.config.TAKE_PROFIT:
+                if pnl_pct >= self._take_profit:
                     return {
                         'action': 'sell',
                         'reason': f'Take profit triggered ({pnl_pct:.2%})',
@@ -110,20 +226,20 @@ class StrategyProfile:
         if current_signal == 1:
             return {
                 'action': 'buy',
-                'reason': f'Buy signal (RSI: {latest["rsi"]:.1f})',
-                'price': latest['close']
+                'reason': f'Buy signal (RSI: {current_rsi:.1f})',
+                'price': current_price
             }
         elif current_signal == -1:
             return {
                 'action': 'sell',
-                'reason': f'Sell signal (RSI: {latest["rsi"]:.1f})',
-                'price': latest['close']
+                'reason': f'Sell signal (RSI: {current_rsi:.1f})',
+                'price': current_price
             }
         else:
             return {
                 'action': 'hold',
                 'reason': 'No clear signal',
-                'price': latest['close']
+                'price': current_price
             }
 
 
@@ -137,6 +253,8 @@ class ConservativeStrategy(StrategyProfile):
     - Best for: Risk-averse traders, volatile markets
     """
     
+    __slots__ = ()
+    
     NAME = "Conservative"
     DESCRIPTION = "Fewer trades, stricter conditions, lower risk"
     
@@ -147,26 +265,25 @@ class ConservativeStrategy(StrategyProfile):
     
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Conservative signal generation - requires multiple confirmations"""
-        df = df.copy()
-        df['signal'] = 0
+        df = df.copy(deep=False)
+        rsi, rsi_prev, fast_ma, slow_ma, fast_ma_prev, slow_ma_prev, close = self._indicator_arrays(df)
         
         # Buy: Requires BOTH RSI recovery AND MA crossover
         buy_condition = (
-            (df['rsi'] > self.RSI_OVERSOLD) &  
-            (df['rsi_prev'] <= self.RSI_OVERSOLD) &
-            (df['fast_ma'] > df['slow_ma']) &
-            (df['fast_ma_prev'] <= df['slow_ma_prev']) &
-            (df['close'] > df['slow_ma'])
+            (rsi > self.RSI_OVERSOLD) &  
+            (rsi_prev <= self.RSI_OVERSOLD) &
+            (fast_ma > slow_ma) &
+            (fast_ma_prev <= slow_ma_prev) &
+            (close > slow_ma)
         )
         
         # Sell: Either overbought OR bearish crossover
         sell_condition = (
-            (df['rsi'] > self.RSI_OVERBOUGHT) |
-            ((df['fast_ma'] < df['slow_ma']) & (df['fast_ma_prev'] >= df['slow_ma_prev']))
+            (rsi > self.RSI_OVERBOUGHT) |
+            ((fast_ma < slow_ma) & (fast_ma_prev >= slow_ma_prev))
         )
         
-        df.loc[buy_condition, 'signal'] = 1
-        df.loc[sell_condition, 'signal'] = -1
+        df['signal'] = self._combine_signals(buy_condition, sell_condition)
         
         return df
 
@@ -181,6 +298,8 @@ class BalancedStrategy(StrategyProfile):
     - Best for: Most traders, normal market conditions
     """
     
+    __slots__ = ()
+    
     NAME = "Balanced"
     DESCRIPTION = "Moderate trades, balanced signals (DEFAULT)"
     
@@ -191,35 +310,34 @@ class BalancedStrategy(StrategyProfile):
     
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Balanced signal generation - OR logic for opportunities"""
-        df = df.copy()
-        df['signal'] = 0
+        df = df.copy(deep=False)
+        rsi, rsi_prev, fast_ma, slow_ma, fast_ma_prev, slow_ma_prev, close = self._indicator_arrays(df)
         
         # Condition 1: RSI recovery with bullish MAs
         rsi_recovery = (
-            (df['rsi'] > self.RSI_OVERSOLD) &
-            (df['rsi_prev'] <= self.RSI_OVERSOLD) &
-            (df['fast_ma'] > df['slow_ma'])
+            (rsi > self.RSI_OVERSOLD) &
+            (rsi_prev <= self.RSI_OVERSOLD) &
+            (fast_ma > slow_ma)
         )
         
         # Condition 2: MA crossover with healthy RSI
         ma_crossover = (
-            (df['fast_ma'] > df['slow_ma']) &
-            (df['fast_ma_prev'] <= df['slow_ma_prev']) &
-            (df['rsi'] < self.RSI_OVERBOUGHT) &
-            (df['rsi'] > self.RSI_OVERSOLD)
+            (fast_ma > slow_ma) &
+            (fast_ma_prev <= slow_ma_prev) &
+            (rsi < self.RSI_OVERBOUGHT) &
+            (rsi > self.RSI_OVERSOLD)
         )
         
         # Buy if EITHER condition is true
-        buy_condition = (rsi_recovery | ma_crossover) & (df['close'] > df['slow_ma'])
+        buy_condition = (rsi_recovery | ma_crossover) & (close > slow_ma)
         
         # Sell conditions
         sell_condition = (
-            (df['rsi'] > self.RSI_OVERBOUGHT) |
-            ((df['fast_ma'] < df['slow_ma']) & (df['fast_ma_prev'] >= df['slow_ma_prev']))
+            (rsi > self.RSI_OVERBOUGHT) |
+            ((fast_ma < slow_ma) & (fast_ma_prev >= slow_ma_prev))
         )
         
-        df.loc[buy_condition, 'signal'] = 1
-        df.loc[sell_condition, 'signal'] = -1
+        df['signal'] = self._combine_signals(buy_condition, sell_condition)
         
         return df
 
@@ -234,6 +352,8 @@ class AggressiveStrategy(StrategyProfile):
     - Best for: Active traders, trending markets
     """
     
+    __slots__ = ()
+    
     NAME = "Aggressive"
     DESCRIPTION = "More trades, looser conditions, higher risk"
     
@@ -244,43 +364,42 @@ class AggressiveStrategy(StrategyProfile):
     
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """Aggressive signal generation - multiple buy opportunities"""
-        df = df.copy()
-        df['signal'] = 0
+        df = df.copy(deep=False)
+        rsi, rsi_prev, fast_ma, slow_ma, fast_ma_prev, slow_ma_prev, close = self._indicator_arrays(df)
         
         # Condition 1: RSI recovery
         rsi_recovery = (
-            (df['rsi'] > self.RSI_OVERSOLD) &
-            (df['rsi_prev'] <= self.RSI_OVERSOLD) &
-            (df['fast_ma'] > df['slow_ma'])
+            (rsi > self.RSI_OVERSOLD) &
+            (rsi_prev <= self.RSI_OVERSOLD) &
+            (fast_ma > slow_ma)
         )
         
         # Condition 2: MA crossover
         ma_crossover = (
-            (df['fast_ma'] > df['slow_ma']) &
-            (df['fast_ma_prev'] <= df['slow_ma_prev']) &
-            (df['rsi'] < self.RSI_OVERBOUGHT)
+            (fast_ma > slow_ma) &
+            (fast_ma_prev <= slow_ma_prev) &
+            (rsi < self.RSI_OVERBOUGHT)
         )
         
         # Condition 3: Strong momentum (NEW for aggressive)
         strong_momentum = (
-            (df['fast_ma'] > df['slow_ma']) &
-            (df['close'] > df['fast_ma']) &
-            (df['rsi'] > 40) & (df['rsi'] < self.RSI_OVERBOUGHT) &
-            (df['rsi'] > df['rsi_prev'])  # RSI increasing
+            (fast_ma > slow_ma) &
+            (close > fast_ma) &
+            (rsi > 40) & (rsi < self.RSI_OVERBOUGHT) &
+            (rsi > rsi_prev)  # RSI increasing
         )
         
         # Buy if ANY condition is true
-        buy_condition = (rsi_recovery | ma_crossover | strong_momentum) & (df['close'] > df['slow_ma'])
+        buy_condition = (rsi_recovery | ma_crossover | strong_momentum) & (close > slow_ma)
         
         # Sell conditions
         sell_condition = (
-            (df['rsi'] > self.RSI_OVERBOUGHT) |
-            ((df['fast_ma'] < df['slow_ma']) & (df['fast_ma_prev'] >= df['slow_ma_prev'])) |
-            (df['rsi'] < self.RSI_OVERSOLD)  # Quick exit on weakness
+            (rsi > self.RSI_OVERBOUGHT) |
+            ((fast_ma < slow_ma) & (fast_ma_prev >= slow_ma_prev)) |
+            (rsi < self.RSI_OVERSOLD)  # Quick exit on weakness
         )
         
-        df.loc[buy_condition, 'signal'] = 1
-        df.loc[sell_condition, 'signal'] = -1
+        df['signal'] = self._combine_signals(buy_condition, sell_condition)
         
         return df
 
@@ -295,10 +414,13 @@ STRATEGIES = {
 DEFAULT_STRATEGY = 'balanced'
 
 
+@lru_cache(maxsize=8)
 def get_strategy(name: str = DEFAULT_STRATEGY, config: Optional[Config] = None) -> StrategyProfile:
     """
     Get a strategy by name.
     
+    Strategies hold no per-call state, so instances are cached and shared.
+    
     Args:
         name: Strategy name ('conservative', 'balanced', or 'aggressive')
         config: Optional Config instance
@@ -6,10 +6,9 @@ This is a conservative day trading strategy that combines:
 """
 import pandas as pd
 import numpy as np
-from ta.momentum import RSIIndicator
-from ta.trend import SMAIndicator
 from typing import Dict, Optional, Any
-from config import Config
+from config import Config, get_config
+import indicators
 
 
 class TradingStrategy:
@@ -32,7 +31,7 @@ class TradingStrategy:
     
     def __init__(self, config: Optional[Config] = None):
         """Initialize strategy with configuration"""
-        self.config = config or Config()
+        self.config = config or get_config()
     
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -55,22 +54,16 @@ class TradingStrategy:
         if missing_columns:
             raise ValueError(f"DataFrame missing required columns: {missing_columns}")
         
-        df = df.copy()
+        # Only whole columns are added, so a shallow copy is enough
+        df = df.copy(deep=False)
+        close = df['close']
         
         # Calculate RSI
-        rsi_indicator = RSIIndicator(close=df['close'], window=self.config.RSI_PERIOD)
-        df['rsi'] = rsi_indicator.rsi()
+        df['rsi'] = indicators.rsi(close, self.config.RSI_PERIOD)
         
         # Calculate Moving Averages
-        fast_ma = SMAIndicator(close=df['close'], window=self.config.FAST_MA_PERIOD)
-        slow_ma = SMAIndicator(close=df['close'], window=self.config.SLOW_MA_PERIOD)
-        df['fast_ma'] = fast_ma.sma_indicator()
-        df['slow_ma'] = slow_ma.sma_indicator()
-        
-        # Calculate previous values for crossover detection
-        df['rsi_prev'] = df['rsi'].shift(1)
-        df['fast_ma_prev'] = df['fast_ma'].shift(1)
-        df['slow_ma_prev'] = df['slow_ma'].shift(1)
+        df['fast_ma'] = close.rolling(window=self.config.FAST_MA_PERIOD).mean()
+        df['slow_ma'] = close.rolling(window=self.config.SLOW_MA_PERIOD).mean()
         
         return df
     
@@ -81,44 +74,56 @@ class TradingStrategy:
         UPDATED: More practical buy conditions that actually generate trades.
         Uses OR logic instead of requiring rare simultaneous events.
         
+        Crossovers compare each bar with the row before it, so the first
+        row of df never signals a crossover.
+        
         Args:
             df: DataFrame with indicators calculated
             
         Returns:
             DataFrame with 'signal' column (1=buy, -1=sell, 0=hold)
         """
-        df = df.copy()
-        df['signal'] = 0
+        df = df.copy(deep=False)
+        
+        # Evaluate the rules on raw arrays rather than aligned Series
+        rsi = df['rsi'].to_numpy()
+        fast_ma = df['fast_ma'].to_numpy()
+        slow_ma = df['slow_ma'].to_numpy()
+        
+        # Previous values for crossover detection
+        rsi_prev = indicators.previous(rsi)
+        fast_ma_prev = indicators.previous(fast_ma)
+        slow_ma_prev = indicators.previous(slow_ma)
         
         # IMPROVED Buy conditions - uses OR for more opportunities
         
         # Condition 1: RSI recovery from oversold with bullish MA alignment
         rsi_recovery = (
-            (df['rsi'] > self.config.RSI_OVERSOLD) &  # RSI above oversold
-            (df['rsi_prev'] <= self.config.RSI_OVERSOLD) &  # Just crossed above
-            (df['fast_ma'] > df['slow_ma'])  # MAs already bullish
+            (rsi > self.config.RSI_OVERSOLD) &  # RSI above oversold
+            (rsi_prev <= self.config.RSI_OVERSOLD) &  # Just crossed above
+            (fast_ma > slow_ma)  # MAs already bullish
         )
         
         # Condition 2: MA bullish crossover with healthy RSI
         ma_crossover = (
-            (df['fast_ma'] > df['slow_ma']) &  # Fast crosses above
-            (df['fast_ma_prev'] <= df['slow_ma_prev']) &  # Just happened
-            (df['rsi'] < self.config.RSI_OVERBOUGHT) &  # Not overbought
-            (df['rsi'] > self.config.RSI_OVERSOLD)  # Not oversold
+            (fast_ma > slow_ma) &  # Fast crosses above
+            (fast_ma_prev <= slow_ma_prev) &  # Just happened
+            (rsi < self.config.RSI_OVERBOUGHT) &  # Not overbought
+            (rsi > self.config.RSI_OVERSOLD)  # Not oversold
         )
         
         # Buy if EITHER condition is true (more practical)
-        buy_condition = (rsi_recovery | ma_crossover) & (df['close'] > df['slow_ma'])
+        buy_condition = (rsi_recovery | ma_crossover) & (df['close'].to_numpy() > slow_ma)
         
         # Sell conditions (unchanged)
         sell_condition = (
-            (df['rsi'] > self.config.RSI_OVERBOUGHT) |  # RSI overbought
-            ((df['fast_ma'] < df['slow_ma']) &  # Fast MA below Slow MA
-            (df['fast_ma_prev'] >= df['slow_ma_prev']))  # Bearish crossover
+            (rsi > self.config.RSI_OVERBOUGHT) |  # RSI overbought
+            ((fast_ma < slow_ma) &  # Fast MA below Slow MA
+            (fast_ma_prev >= slow_ma_prev))  # Bearish crossover
         )
         
-        df.loc[buy_condition, 'signal'] = 1
-        df.loc[sell_condition, 'signal'] = -1
+        # Sell wins when both hold, as it did when assigned last
+        df['signal'] = np.where(sell_condition, -1, np.where(buy_condition, 1, 0))
         
         return df
     
@@ -152,25 +157,29 @@ class TradingStrategy:
         if df.empty:
             raise ValueError("Cannot generate signal from empty DataFrame")
         
-        analyzed_df = self.analyze(df)
-        latest = analyzed_df.iloc[-1]
+        # Indicators need the full history, but only the latest bar's signal is
+        # used; its crossover rules also need the bar before it
+        df_with_indicators = self.calculate_indicators(df)
+        latest = self.generate_signals(df_with_indicators.iloc[-2:])
         
-        signal_value = latest['signal']
+        # Read each column's last value directly instead of building a row Series
+        signal_value = int(latest['signal'].to_numpy()[-1])
+        price = float(latest['close'].to_numpy()[-1])
         
         result = {
             'signal': 'hold',
             'signal_value': signal_value,
-            'price': latest['close'],
-            'rsi': latest['rsi'],
-            'fast_ma': latest['fast_ma'],
-            'slow_ma': latest['slow_ma'],
-            'timestamp': latest.name
+            'price': price,
+            'rsi': float(latest['rsi'].to_numpy()[-1]),
+            'fast_ma': float(latest['fast_ma'].to_numpy()[-1]),
+            'slow_ma': float(latest['slow_ma'].to_numpy()[-1]),
+            'timestamp': latest.index[-1]
         }
         
         if signal_value == 1:
             result['signal'] = 'buy'
-            result['stop_loss'] = latest['close'] * (1 - self.config.STOP_LOSS_PCT)
-            result['take_profit'] = latest['close'] * (1 + self.config.TAKE_PROFIT_PCT)
+            result['stop_loss'] = price * (1 - self.config.STOP_LOSS_PCT)
+            result['take_profit'] = price * (1 + self.config.TAKE_PROFIT_PCT)
         elif signal_value == -1:
             result['signal'] = 'sell'
         
@@ -3,11 +3,11 @@ Main trading bot that combines strategy, data, and broker integration.
 This is the main entry point for live trading.
 """
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from strategy import TradingStrategy
 from data_fetcher import DataFetcher
 from broker import Broker
-from config import Config
+from config import Config, get_config
 
 
 class Trader:
@@ -27,7 +27,7 @@ class Trader:
             paper_trading: Use paper trading account
         """
         self.symbol = symbol.upper()
-        self.config = config or Config()
+        self.config = config or get_config()
         self.strategy = TradingStrategy(self.config)
         self.data_fetcher = DataFetcher(source='alpaca')
         self.broker = Broker(self.config, paper_trading=paper_trading)
@@ -77,6 +77,23 @@ class Trader:
         
         # Check existing positions
         positions = self.broker.get_positions()
+        
+        return self._execute_signal(signal_info, positions, dry_run)
+    
+    def _execute_signal(self, signal_info: Dict, positions: List[Dict], dry_run: bool,
+                        account_info: Optional[Dict] = None) -> Dict:
+        """
+        Act on an already computed signal.
+        
+        Args:
+            signal_info: Result of analyze_current_market()
+            positions: Current broker positions
+            dry_run: If True, only simulate trades without executing
+            account_info: Account info if already fetched (fetched on demand otherwise)
+            
+        Returns:
+            Dictionary with action taken and results
+        """
         symbol_position = next((p for p in positions if p['symbol'] == self.symbol), None)
         
         result = {
@@ -92,7 +109,8 @@ class Trader:
         # Handle buy signal
         if signal_info['signal'] == 'buy' and symbol_position is None:
             # Calculate position size
-            account_info = self.broker.get_account_info()
+            if account_info is None:
+                account_info = self.broker.get_account_info()
             risk_amount = account_info['buying_power'] * self.config.RISK_PER_TRADE
             entry_price = signal_info['price']
             stop_loss_price = signal_info.get('stop_loss', entry_price * (1 - self.config.STOP_LOSS_PCT))
@@ -183,4 +201,41 @@ class Trader:
             'symbol': self.symbol,
             'market_open': self.broker.is_market_open()
         }
+    
+    def step(self, dry_run: bool = True) -> Dict:
+        """
+        Run one trading iteration.
+        
+        Fetches data and computes the signal once, then uses it both for the
+        status report and for trade execution (get_status() followed by
+        check_and_execute() would analyze the market twice).
+        
+        Args:
+            dry_run: If True, only simulate trades without executing
+            
+        Returns:
+            Status dictionary (same keys as get_status()) with the action
+            taken under 'result'
+        """
+        market_open = self.broker.is_market_open()
+        account_info = self.broker.get_account_info()
+        positions = self.broker.get_positions()
+        signal_info = self.analyze_current_market()
+        
+        if market_open:
+            result = self._execute_signal(signal_info, positions, dry_run, account_info)
+        else:
+            result = {
+                'action': 'market_closed',
+                'message': 'Market is currently closed'
+            }
+        
+        return {
+            'account': account_info,
+            'positions': positions,
+            'current_signal': signal_info,
+            'symbol': self.symbol,
+            'market_open': market_open,
+            'result': result
+        }
 
@@ -3,6 +3,7 @@ DataFrame schema validation for the trading system.
 Ensures data integrity and catches issues early.
 """
 import pandas as pd
+import numpy as np
 from typing import List, Optional
 from dataclasses import dataclass
 
@@ -61,9 +62,9 @@ class OHLCVValidator:
                 raise ValueError(f"Validation failed: {error.message}")
             return errors  # Can't continue without columns
         
-        # Check for null values
-        for col in cls.REQUIRED_COLUMNS:
-            null_count = df[col].isna().sum()
+        # Check for null values (one reduction over all required columns)
+        null_counts = df[cls.REQUIRED_COLUMNS].isna().to_numpy().sum(axis=0)
+        for col, null_count in zip(cls.REQUIRED_COLUMNS, null_counts):
             if null_count > 0:
                 error = ValidationError(
                     col,
@@ -75,8 +76,9 @@ class OHLCVValidator:
                     raise ValueError(f"Validation failed: {error.message}")
         
         # Check data types (should be numeric)
-        for col in cls.REQUIRED_COLUMNS:
-            if not pd.api.types.is_numeric_dtype(df[col]):
+        numeric = [pd.api.types.is_numeric_dtype(df[col]) for col in cls.REQUIRED_COLUMNS]
+        for col, is_numeric in zip(cls.REQUIRED_COLUMNS, numeric):
+            if not is_numeric:
                 error = ValidationError(
                     col,
                     'wrong_type',
@@ -87,12 +89,17 @@ class OHLCVValidator:
                     raise ValueError(f"Validation failed: {error.message}")
         
         # Only check numeric constraints if data types are correct
-        if all(pd.api.types.is_numeric_dtype(df[col]) for col in cls.REQUIRED_COLUMNS):
+        if all(numeric):
+            # One (rows, 5) array in REQUIRED_COLUMNS order; NaN compares False
+            # in every check below, as it does on the columns themselves
+            values = df[cls.REQUIRED_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+            open_, high, low, close, volume = values.T
+            
             # Check for negative prices
             price_cols = ['open', 'high', 'low', 'close']
-            for col in price_cols:
-                if (df[col] <= 0).any():
-                    negative_count = (df[col] <= 0).sum()
+            non_positive_counts = (values[:, :4] <= 0).sum(axis=0)
+            for col, negative_count in zip(price_cols, non_positive_counts):
+                if negative_count > 0:
                     error = ValidationError(
                         col,
                         'invalid_value',
@@ -103,7 +110,7 @@ class OHLCVValidator:
                         raise ValueError(f"Validation failed: {error.message}")
             
             # Check for negative volume
-            if (df['volume'] < 0).any():
+            if (volume < 0).any():
                 error = ValidationError(
                     'volume',
                     'invalid_value',
@@ -114,7 +121,7 @@ class OHLCVValidator:
                     raise ValueError(f"Validation failed: {error.message}")
         
             # Check OHLC relationships (High >= Low, etc.) - only if numeric
-            invalid_hl = (df['high'] < df['low']).sum()
+            invalid_hl = np.count_nonzero(high < low)
             if invalid_hl > 0:
                 error = ValidationError(
                     'high_low',
@@ -125,7 +132,7 @@ class OHLCVValidator:
                 if strict:
                     raise ValueError(f"Validation failed: {error.message}")
             
-            invalid_close = ((df['close'] > df['high']) | (df['close'] < df['low'])).sum()
+            invalid_close = np.count_nonzero((close > high) | (close < low))
             if invalid_close > 0:
                 error = ValidationError(
                     'close',
@@ -136,7 +143,7 @@ class OHLCVValidator:
                 if strict:
                     raise ValueError(f"Validation failed: {error.message}")
             
-            invalid_open = ((df['open'] > df['high']) | (df['open'] < df['low'])).sum()
+            invalid_open = np.count_nonzero((open_ > high) | (open_ < low))
             if invalid_open > 0:
                 error = ValidationError(
                     'open',
@@ -159,8 +166,9 @@ class OHLCVValidator:
                 raise ValueError(f"Validation failed: {error.message}")
         
         # Check for duplicate timestamps
-        if df.index.duplicated().any():
-            dup_count = df.index.duplicated().sum()
+        duplicated = df.index.duplicated()
+        if duplicated.any():
+            dup_count = duplicated.sum()
             error = ValidationError(
                 'index',
                 'duplicates',
@@ -13,6 +13,16 @@ import numpy as np
 from datetime import datetime, timedelta
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_cache(tmp_path, monkeypatch):
+    """Keep the on-disk bar cache out of the working directory during tests"""
+    from config import Config
+    
+    cache_dir = tmp_path / 'bars'
+    monkeypatch.setattr(Config, 'DATA_CACHE_DIR', str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def sample_ohlcv_data():
     """Create sample OHLCV data for testing"""
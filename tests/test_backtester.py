@@ -73,6 +73,29 @@ class TestBacktester:
             assert all(t['entry_price'] > 0 for t in trades)
             assert all(t['shares'] > 0 for t in trades)
     
+    def test_simulate_trades_exit_reasons(self):
+        """Test stop loss, sell signal and end of backtest exits"""
+        backtester = Backtester(initial_capital=10000)
+        stop = backtester.config.STOP_LOSS_PCT
+        
+        dates = pd.date_range('2024-01-01', periods=8, freq='D')
+        df = pd.DataFrame({
+            # Bar 2 drops through the stop and re-enters on its own buy signal
+            'close': [100.0, 100.0, 100 * (1 - stop * 2), 99.0, 99.0, 99.0, 99.0, 99.0],
+            'signal': [1, 0, 1, 0, -1, 0, 1, 0]
+        }, index=dates)
+        
+        trades, portfolio_value = backtester._simulate_trades(df)
+        
+        assert [t['exit_reason'] for t in trades] == ['stop_loss', 'signal', 'end_of_backtest']
+        assert trades[0]['exit_time'] == trades[1]['entry_time'] == dates[2]
+        assert trades[2]['exit_time'] == dates[-1]
+        assert len(portfolio_value) == len(df)
+        assert portfolio_value.iloc[5] == portfolio_value.iloc[4]
+        assert portfolio_value.iloc[-1] == pytest.approx(
+            backtester.initial_capital + sum(t['pnl'] for t in trades)
+        )
+    
     def test_calculate_metrics_no_trades(self):
         """Test metrics calculation with no trades"""
         backtester = Backtester(initial_capital=10000)
@@ -3,7 +3,7 @@ Tests for configuration module.
 """
 import os
 import pytest
-from config import Config
+from config import Config, get_config
 
 
 class TestConfig:
@@ -54,4 +54,9 @@ class TestConfig:
         # Take profit should be 2x stop loss (2:1 risk/reward)
         expected_ratio = config.TAKE_PROFIT_PCT / config.STOP_LOSS_PCT
         assert expected_ratio == 2.0, "Risk/reward ratio should be 2:1"
-
+    
+    def test_get_config_shared_instance(self):
+        """Test that get_config returns one shared instance"""
+        config = get_config()
+        assert isinstance(config, Config)
+        assert get_config() is config
@@ -0,0 +1,46 @@
+"""
+Tests for data cache module.
+"""
+import pytest
+from unittest.mock import patch
+from data_cache import DataCache, compare_strategies_on_cached_data
+from strategies import StrategyProfile
+
+
+class TestDataCache:
+    """Test data cache functionality"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path, sample_ohlcv_data):
+        """Cache holding two symbols, kept out of the working directory"""
+        cache = DataCache(cache_dir=str(tmp_path))
+        for symbol in ['AAPL', 'MSFT']:
+            cache.memory_cache[symbol] = sample_ohlcv_data
+            cache.cache_metadata[symbol] = {'fetched_at': '2024-01-01T00:00:00', 'period': 30}
+        return cache
+    
+    def test_compare_strategies_reuses_analysis(self, cache):
+        """Test that a repeat comparison on unchanged data skips analysis"""
+        with patch.object(StrategyProfile, 'analyze_batch',
+                          autospec=True, side_effect=StrategyProfile.analyze_batch) as analyze:
+            first = compare_strategies_on_cached_data(cache, ['AAPL', 'MSFT'])
+            assert analyze.call_count == 3
+            
+            second = compare_strategies_on_cached_data(cache, ['AAPL', 'MSFT'])
+            assert analyze.call_count == 3
+        
+        assert first.equals(second)
+    
+    def test_latest_signals_invalidated_by_refetch(self, cache):
+        """Test that refetching a symbol or changing the symbols re-analyzes"""
+        first = cache.get_latest_signals('balanced', ['AAPL', 'MSFT'])
+        assert cache.get_latest_signals('balanced', ['AAPL', 'MSFT']) is first
+        
+        cache.cache_metadata['MSFT']['fetched_at'] = '2024-01-02T00:00:00'
+        assert cache.get_latest_signals('balanced', ['AAPL', 'MSFT']) is not first
+        
+        only_aapl = cache.get_latest_signals('balanced', ['AAPL'])
+        assert list(only_aapl.index) == ['AAPL']
+        
+        cache.clear_cache()
+        assert cache.analysis_cache == {}
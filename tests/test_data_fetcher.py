@@ -4,7 +4,7 @@ Tests for data fetcher module.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
-from data_fetcher import DataFetcher
+from data_fetcher import DataFetcher, downcast_ohlcv, get_default_fetcher
 from config import Config
 
 
@@ -65,6 +65,33 @@ class TestDataFetcher:
         assert 'low' in df.columns
         assert 'volume' in df.columns
     
+    @patch('yfinance.Ticker')
+    def test_fetch_yfinance_downcast(self, mock_ticker):
+        """Test that downcast=True returns compact OHLCV dtypes"""
+        mock_data = pd.DataFrame({
+            'Open': [100.0, 101.0], 'High': [101.0, 102.0], 'Low': [99.0, 100.0],
+            'Close': [100.5, 101.5], 'Volume': [1000000, 1100000]
+        }, index=pd.date_range(end=pd.Timestamp.now(), periods=2, freq='5min'))
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.return_value = mock_data
+        mock_ticker.return_value = mock_ticker_instance
+        
+        fetcher = DataFetcher(source='yfinance', downcast=True)
+        df = fetcher.fetch_data('AAPL', period=1)
+        
+        assert (df[['open', 'high', 'low', 'close']].dtypes == 'float32').all()
+        assert df['volume'].dtype == 'uint32'
+        assert df['close'].iloc[-1] == 101.5
+    
+    def test_downcast_ohlcv_keeps_negative_volume(self):
+        """Test that volume is only downcast to unsigned when non-negative"""
+        df = pd.DataFrame({'close': [1.0], 'volume': [-1]})
+        result = downcast_ohlcv(df)
+        
+        assert result['close'].dtype == 'float32'
+        assert result['volume'].dtype == 'int64'
+    
     @patch('yfinance.Ticker')
     def test_fetch_yfinance_empty_data(self, mock_ticker):
         """Test handling of empty data from yfinance"""
@@ -96,6 +123,197 @@ class TestDataFetcher:
         
         assert price == 150.25
         assert isinstance(price, float)
+        mock_ticker_instance.history.assert_called_once_with(period='1d', interval='1d')
+    
+    @patch('yfinance.Ticker')
+    def test_fetch_yfinance_uses_disk_cache(self, mock_ticker, isolated_data_cache):
+        """Test that cached days are reused and only the tail is refetched"""
+        index = pd.date_range(end=pd.Timestamp.now().normalize(), periods=20, freq='D')
+        mock_data = pd.DataFrame({
+            'Open': range(100, 120),
+            'High': range(101, 121),
+            'Low': range(99, 119),
+            'Close': range(100, 120),
+            'Volume': [1000000] * 20
+        }, index=index)
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.return_value = mock_data
+        mock_ticker.return_value = mock_ticker_instance
+        
+        fetcher = DataFetcher(source='yfinance')
+        first = fetcher.fetch_data('AAPL', period=10)
+        assert (isolated_data_cache / '1d' / 'AAPL.pkl').exists()
+        
+        # Second fetch should only ask yfinance for the last cached bar onwards
+        mock_ticker_instance.history.return_value = mock_data.iloc[-2:].copy()
+        second = fetcher.fetch_data('AAPL', period=10)
+        
+        tail_start = mock_ticker_instance.history.call_args.kwargs['start']
+        assert tail_start.date() == index[-2].date()
+        assert mock_ticker_instance.history.call_count == 2
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+    
+    @patch('yfinance.Ticker')
+    def test_fetch_yfinance_cache_refetches_readjusted_history(self, mock_ticker, isolated_data_cache):
+        """Test that a changed close on the last cached bar discards the cache"""
+        index = pd.date_range(end=pd.Timestamp.now().normalize(), periods=20, freq='D')
+        mock_data = pd.DataFrame({
+            'Open': range(100, 120), 'High': range(101, 121), 'Low': range(99, 119),
+            'Close': range(100, 120), 'Volume': [1000000] * 20
+        }, index=index, dtype=float)
+        
+        # A 2:1 split halves every adjusted price, including the cached ones
+        split = mock_data.assign(Open=mock_data['Open'] / 2, High=mock_data['High'] / 2,
+                                 Low=mock_data['Low'] / 2, Close=mock_data['Close'] / 2)
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.side_effect = lambda **kwargs: mock_data.copy()
+        mock_ticker.return_value = mock_ticker_instance
+        
+        fetcher = DataFetcher(source='yfinance')
+        fetcher.fetch_data('AAPL', period=10)
+        
+        mock_ticker_instance.history.side_effect = lambda **kwargs: split.copy()
+        df = fetcher.fetch_data('AAPL', period=10)
+        
+        assert mock_ticker_instance.history.call_count == 3
+        refetch_start = mock_ticker_instance.history.call_args.kwargs['start']
+        assert refetch_start.date() == (pd.Timestamp.now() - pd.Timedelta(days=10)).date()
+        assert (df['close'].to_numpy() == split['Close'].iloc[-len(df):].to_numpy()).all()
+        cached = pd.read_pickle(isolated_data_cache / '1d' / 'AAPL.pkl')
+        assert cached['data']['close'].iloc[-1] == split['Close'].iloc[-2]
+    
+    @patch('yfinance.Ticker')
+    def test_fetch_yfinance_cache_uses_exchange_day(self, mock_ticker, isolated_data_cache):
+        """Test that the exchange's current day is never cached, whatever the local date"""
+        # UTC-12 is behind the local clock for most of the day
+        tz = 'Etc/GMT+12'
+        exchange_today = pd.Timestamp.now(tz=tz).normalize()
+        index = pd.date_range(end=exchange_today, periods=20, freq='D')
+        mock_data = pd.DataFrame({
+            'Open': range(100, 120), 'High': range(101, 121), 'Low': range(99, 119),
+            'Close': range(100, 120), 'Volume': [1000000] * 20
+        }, index=index)
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.return_value = mock_data
+        mock_ticker.return_value = mock_ticker_instance
+        
+        df = DataFetcher(source='yfinance').fetch_data('AAPL', period=10)
+        cached = pd.read_pickle(isolated_data_cache / '1d' / 'AAPL.pkl')
+        
+        assert cached['end'] < exchange_today.date()
+        assert cached['data'].index[-1] < exchange_today
+        start = (pd.Timestamp.now() - pd.Timedelta(days=10)).tz_localize(tz)
+        assert df.index[0] >= start
+        assert df.index[-1] == exchange_today
+    
+    @patch('yfinance.Ticker')
+    def test_fetch_yfinance_cache_disabled(self, mock_ticker, isolated_data_cache):
+        """Test that an empty cache_dir bypasses the disk cache"""
+        mock_data = pd.DataFrame({
+            'Open': [100, 101], 'High': [101, 102], 'Low': [99, 100],
+            'Close': [100.5, 101.5], 'Volume': [1000000, 1100000]
+        }, index=pd.date_range(end=pd.Timestamp.now(), periods=2, freq='D'))
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.return_value = mock_data
+        mock_ticker.return_value = mock_ticker_instance
+        
+        fetcher = DataFetcher(source='yfinance', cache_dir='')
+        df = fetcher.fetch_data('AAPL', period=5)
+        
+        assert len(df) == 2
+        assert not isolated_data_cache.exists()
+    
+    @patch('yfinance.download')
+    def test_fetch_batch_yfinance(self, mock_download):
+        """Test fetching several symbols with one batched download"""
+        index = pd.date_range(end=pd.Timestamp.now(), periods=3, freq='1h')
+        frames = {}
+        for symbol in ['AAPL', 'MSFT']:
+            frames[symbol] = pd.DataFrame({
+                'Open': [100, 101, 102],
+                'High': [101, 102, 103],
+                'Low': [99, 100, 101],
+                'Close': [100.5, 101.5, 102.5],
+                'Volume': [1000000, 1100000, 1200000]
+            }, index=index)
+        mock_download.return_value = pd.concat(frames, axis=1)
+        
+        fetcher = DataFetcher(source='yfinance')
+        data = fetcher.fetch_batch(['AAPL', 'MSFT', 'INVALID'], period=1)
+        
+        # One request for all symbols
+        assert mock_download.call_count == 1
+        assert set(data.keys()) == {'AAPL', 'MSFT'}
+        assert list(data['AAPL'].columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert data['MSFT'].index.name == 'datetime'
+        assert len(data['MSFT']) == 3
+    
+    @patch('yfinance.download')
+    def test_fetch_batch_empty(self, mock_download):
+        """Test batched fetch with no data returned"""
+        mock_download.return_value = pd.DataFrame()
+        
+        fetcher = DataFetcher(source='yfinance')
+        assert fetcher.fetch_batch(['INVALID'], period=1) == {}
+    
+    def test_fetch_batch_alpaca(self):
+        """Test batched fetch sends one multi-symbol Alpaca request"""
+        index = pd.date_range(end=pd.Timestamp.now(), periods=2, freq='5min')
+        bars = pd.DataFrame({
+            'close': [100.0, 101.0, 200.0, 201.0],
+            'volume': [1000, 1100, 2000, 2100],
+            'symbol': ['MSFT', 'MSFT', 'AAPL', 'AAPL']
+        }, index=index.append(index))
+        
+        mock_api = Mock()
+        mock_api.get_bars.return_value.df = bars
+        
+        fetcher = DataFetcher(source='alpaca')
+        with patch.object(fetcher, '_get_alpaca_api', return_value=mock_api):
+            data = fetcher.fetch_batch(['AAPL', 'INVALID', 'MSFT'], period=1)
+        
+        assert mock_api.get_bars.call_count == 1
+        assert mock_api.get_bars.call_args[0][0] == ['AAPL', 'INVALID', 'MSFT']
+        assert list(data.keys()) == ['AAPL', 'MSFT']
+        assert list(data['AAPL']['close']) == [200.0, 201.0]
+        assert 'symbol' not in data['MSFT'].columns
+    
+    def test_fetch_batch_no_symbols(self):
+        """Test batched fetch rejects an empty symbol list"""
+        fetcher = DataFetcher(source='yfinance')
+        with pytest.raises(ValueError):
+            fetcher.fetch_batch([])
+    
+    def test_get_default_fetcher_shared(self):
+        """Test that the default fetcher is shared per set of options"""
+        get_default_fetcher.cache_clear()
+        try:
+            assert get_default_fetcher() is get_default_fetcher()
+            assert get_default_fetcher(downcast=True).downcast is True
+            assert get_default_fetcher(downcast=True) is not get_default_fetcher()
+        finally:
+            get_default_fetcher.cache_clear()
+    
+    @patch('yfinance.Ticker')
+    def test_get_current_price_reuses_ticker(self, mock_ticker):
+        """Test that repeated price lookups reuse one Ticker per symbol"""
+        mock_data = pd.DataFrame({'Close': [150.25]})
+        mock_data.index = pd.date_range(end=pd.Timestamp.now(), periods=1, freq='1min')
+        
+        mock_ticker_instance = Mock()
+        mock_ticker_instance.history.return_value = mock_data
+        mock_ticker.return_value = mock_ticker_instance
+        
+        fetcher = DataFetcher(source='yfinance')
+        fetcher.get_current_price('AAPL')
+        fetcher.get_current_price('AAPL')
+        
+        assert mock_ticker.call_count == 1
+        assert mock_ticker_instance.history.call_count == 2
     
     @patch('alpaca_trade_api.REST')
     def test_fetch_alpaca_data(self, mock_rest):
@@ -0,0 +1,33 @@
+"""
+Tests for indicators module.
+"""
+import numpy as np
+import pandas as pd
+from indicators import rsi, previous
+
+
+class TestIndicators:
+    """Test shared technical indicators"""
+    
+    def test_rsi_bounds(self, sample_ohlcv_data):
+        """Test that RSI stays within 0-100 once warmed up"""
+        values = rsi(sample_ohlcv_data['close'], 14)
+        
+        assert values.iloc[:13].isna().all()
+        assert values.iloc[13:].between(0, 100).all()
+    
+    def test_rsi_frame_matches_series(self, sample_ohlcv_data):
+        """Test that RSI over a frame matches RSI of each column"""
+        close = sample_ohlcv_data['close']
+        frame = pd.DataFrame({'a': close.to_numpy(), 'b': close.to_numpy()[::-1]})
+        
+        values = rsi(frame, 14)
+        
+        np.testing.assert_allclose(values['a'], rsi(frame['a'], 14))
+        np.testing.assert_allclose(values['b'], rsi(frame['b'], 14))
+    
+    def test_previous(self):
+        """Test that previous matches shift(1)"""
+        values = np.array([1.0, 2.0, 3.0])
+        
+        np.testing.assert_array_equal(previous(values), pd.Series(values).shift(1).to_numpy())
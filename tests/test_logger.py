@@ -3,6 +3,7 @@ Tests for logging module.
 """
 import pytest
 import logging
+import logging.handlers
 from logger import TradingLogger, get_logger
 from pathlib import Path
 import tempfile
@@ -15,7 +16,6 @@ class TestTradingLogger:
     def setup_method(self):
         """Reset logger between tests"""
         TradingLogger._configured = False
-        TradingLogger._loggers.clear()
         logging.getLogger().handlers.clear()
     
     def test_logger_setup(self):
@@ -46,6 +46,30 @@ class TestTradingLogger:
             log_files = list(Path(tmpdir).glob("*.log"))
             assert len(log_files) > 0
     
+    def test_logger_file_written_in_background(self):
+        """Test that queued file records are written out on shutdown"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            TradingLogger.setup(log_level="DEBUG", log_dir=tmpdir)
+            logger = TradingLogger.get_logger("test")
+            logger.debug("Queued message")
+            
+            TradingLogger.shutdown()
+            
+            log_file = next(Path(tmpdir).glob("*.log"))
+            assert "Queued message" in log_file.read_text()
+    
+    def test_logger_shutdown_detaches_file_writer(self):
+        """Test that shutdown removes the queue handler and closes the log file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            TradingLogger.setup(log_level="DEBUG", log_dir=tmpdir)
+            file_handler = TradingLogger._listener.handlers[0]
+            
+            TradingLogger.shutdown()
+            
+            root_handlers = logging.getLogger().handlers
+            assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+            assert file_handler.stream is None
+    
     def test_logger_levels(self):
         """Test different log levels"""
         TradingLogger.setup(log_level="WARNING")
@@ -2,10 +2,13 @@
 Tests for monitoring module.
 """
 import pytest
-from monitoring import MonitoringSystem, get_monitor, MetricSnapshot
+import numpy as np
+from monitoring import MonitoringSystem, TimingBuffer, get_monitor, MetricSnapshot
+import threading
 import time
 import tempfile
 import json
+from datetime import datetime
 
 
 class TestMonitoringSystem:
@@ -48,6 +51,36 @@ class TestMonitoringSystem:
         assert monitor.metrics['warnings_test_category'] == 1
         assert len(monitor.warnings['test_category']) == 1
     
+    def test_error_history_bounded(self):
+        """Test that old error entries are dropped but still counted"""
+        monitor = MonitoringSystem()
+        
+        for i in range(monitor.MAX_EVENTS + 5):
+            monitor.record_error("test", ValueError(f"Error {i}"))
+        
+        assert len(monitor.errors['test']) == monitor.MAX_EVENTS
+        assert monitor.errors['test'][0]['message'] == 'Error 5'
+        assert isinstance(monitor.errors['test'][0]['timestamp'], int)
+        assert monitor.get_summary()['errors']['by_category']['test'] == monitor.MAX_EVENTS + 5
+    
+    def test_get_errors_readable_timestamps(self):
+        """Test that entries read through the accessors carry ISO timestamps"""
+        monitor = MonitoringSystem()
+        
+        monitor.record_error("test", ValueError("Error"))
+        monitor.record_warning("other", "Warning")
+        
+        errors = monitor.get_errors("test")
+        assert errors[0]['message'] == 'Error'
+        assert datetime.fromisoformat(errors[0]['timestamp'])
+        assert isinstance(monitor.errors['test'][0]['timestamp'], int)
+        assert monitor.get_errors("missing") == []
+        assert len(monitor.get_warnings()) == 1
+        
+        summary = monitor.get_summary()
+        assert summary['errors']['last_seen']['test'] == errors[0]['timestamp']
+        assert 'other' in summary['warnings']['last_seen']
+    
     def test_record_metric(self):
         """Test recording metrics"""
         monitor = MonitoringSystem()
@@ -58,6 +91,22 @@ class TestMonitoringSystem:
         monitor.record_metric("test_metric", 3)
         assert monitor.metrics['test_metric'] == 8
     
+    def test_record_metric_concurrent(self):
+        """Test that concurrent increments are not lost"""
+        monitor = MonitoringSystem()
+        
+        def work():
+            for _ in range(10000):
+                monitor.record_metric("shared")
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert monitor.metrics['shared'] == 80000
+    
     def test_record_timing(self):
         """Test recording operation timings"""
         monitor = MonitoringSystem()
@@ -69,6 +118,18 @@ class TestMonitoringSystem:
         avg = monitor.get_avg_timing("test_op")
         assert avg == 150.5
     
+    def test_timing_buffer_keeps_recent(self):
+        """Test that timings are capped and stats cover the recent window"""
+        buffer = TimingBuffer(capacity=100)
+        
+        for i in range(250):
+            buffer.append(float(i))
+        
+        assert len(buffer) == 100
+        assert buffer.mean() == pytest.approx(np.mean(np.arange(150, 250)))
+        assert buffer.percentiles() == (200.0, 249.0)
+        assert sorted(buffer.values()) == list(range(150, 250))
+    
     def test_get_error_rate(self):
         """Test error rate calculation"""
         monitor = MonitoringSystem()
@@ -110,6 +171,7 @@ class TestMonitoringSystem:
         assert 'timings' in summary
         assert summary['errors']['total'] == 1
         assert summary['metrics']['api_calls'] == 5
+        assert summary['timings']['fetch_data']['p99_ms'] == 123.4
     
     def test_save_report(self):
         """Test saving monitoring report"""
@@ -0,0 +1,138 @@
+"""
+Tests for strategy profiles module.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from strategies import get_strategy, STRATEGIES, LATEST_COLUMNS
+
+
+class TestStrategyProfiles:
+    """Test strategy profile analysis"""
+    
+    @pytest.mark.parametrize('name', list(STRATEGIES))
+    def test_analyze_tail_matches_analyze(self, name, sample_ohlcv_data):
+        """Test that analyze_tail reports the same values as the full analysis"""
+        strategy = get_strategy(name)
+        
+        latest = strategy.analyze_tail(sample_ohlcv_data)
+        expected = strategy.analyze(sample_ohlcv_data).iloc[-1]
+        
+        assert set(latest) == set(LATEST_COLUMNS)
+        for col in LATEST_COLUMNS:
+            np.testing.assert_allclose(latest[col], expected[col])
+    
+    @pytest.mark.parametrize('name', list(STRATEGIES))
+    def test_analyze_leaves_input_unchanged(self, name, sample_ohlcv_data):
+        """Test that analysis does not modify the caller's DataFrame"""
+        original = sample_ohlcv_data.copy()
+        
+        analyzed = get_strategy(name).analyze(sample_ohlcv_data)
+        analyzed['close'] = 0.0
+        
+        pd.testing.assert_frame_equal(sample_ohlcv_data, original)
+    
+    @pytest.mark.parametrize('name', list(STRATEGIES))
+    def test_analyze_derives_previous_values(self, name, sample_ohlcv_data):
+        """Test that crossovers use the preceding row rather than stored shifted columns"""
+        strategy = get_strategy(name)
+        analyzed = strategy.analyze(sample_ohlcv_data)
+        
+        assert not analyzed.columns.str.endswith('_prev').any()
+        # Signals for bar i depend only on rows i-1 and i
+        for end in range(2, len(analyzed) + 1):
+            window = strategy.generate_signals(analyzed.iloc[end - 2:end])
+            assert window['signal'].iloc[-1] == analyzed['signal'].iloc[end - 1]
+    
+    def test_analyze_tail_volume_window(self, sample_ohlcv_data):
+        """Test that analyze_tail can report recent average volume"""
+        strategy = get_strategy('balanced')
+        
+        latest = strategy.analyze_tail(sample_ohlcv_data, volume_window=20)
+        
+        assert latest['avg_volume'] == pytest.approx(sample_ohlcv_data['volume'].tail(20).mean())
+        assert 'avg_volume' not in strategy.analyze_tail(sample_ohlcv_data)
+    
+    def test_analyze_tail_volume_window_skips_nan(self, sample_ohlcv_data):
+        """Test that a missing volume bar does not make the average NaN"""
+        strategy = get_strategy('balanced')
+        df = sample_ohlcv_data.astype({'volume': float})
+        df.iloc[-3, df.columns.get_loc('volume')] = np.nan
+        
+        latest = strategy.analyze_tail(df, volume_window=20)
+        
+        assert latest['avg_volume'] == pytest.approx(df['volume'].tail(20).dropna().mean())
+    
+    @pytest.mark.parametrize('name', list(STRATEGIES))
+    def test_analyze_batch_matches_analyze_tail(self, name, sample_ohlcv_data):
+        """Test that batch analysis matches per-symbol analysis"""
+        strategy = get_strategy(name)
+        frames = {
+            'FULL': sample_ohlcv_data,
+            'SHORT': sample_ohlcv_data.iloc[:60],
+            'SCALED': sample_ohlcv_data * 2,
+        }
+        
+        result = strategy.analyze_batch(frames)
+        
+        assert list(result.index) == list(frames)
+        for symbol, df in frames.items():
+            expected = strategy.analyze_tail(df)
+            for col in LATEST_COLUMNS:
+                np.testing.assert_allclose(result.loc[symbol, col], expected[col])
+    
+    def test_analyze_batch_shared_indicators(self, sample_ohlcv_data):
+        """Test that strategies sharing indicators get the same results"""
+        frames = {'FULL': sample_ohlcv_data, 'SHORT': sample_ohlcv_data.iloc[:60]}
+        shared = {}
+        
+        for name in STRATEGIES:
+            strategy = get_strategy(name)
+            pd.testing.assert_frame_equal(
+                strategy.analyze_batch(frames, shared),
+                strategy.analyze_batch(frames)
+            )
+        
+        assert ('rsi', len(sample_ohlcv_data), 14) in shared
+    
+    def test_analyze_batch_skips_empty_data(self, sample_ohlcv_data):
+        """Test that batch analysis leaves out symbols without data"""
+        strategy = get_strategy('balanced')
+        
+        result = strategy.analyze_batch({'AAPL': sample_ohlcv_data, 'EMPTY': pd.DataFrame()})
+        
+        assert list(result.index) == ['AAPL']
+    
+    def test_analyze_tail_empty_data(self):
+        """Test that analyze_tail rejects empty data like analyze does"""
+        strategy = get_strategy('balanced')
+        
+        with pytest.raises(ValueError):
+            strategy.analyze_tail(pd.DataFrame())
+    
+    def test_get_current_signal_position_exits(self, sample_ohlcv_data):
+        """Test stop loss and take profit exits for an open position"""
+        strategy = get_strategy('balanced')
+        analyzed = strategy.analyze(sample_ohlcv_data)
+        price = analyzed['close'].iloc[-1]
+        stop = strategy.config.STOP_LOSS_PCT
+        target = strategy.config.TAKE_PROFIT_PCT
+        
+        stopped = strategy.get_current_signal(
+            analyzed, {'entry_price': price / (1 - stop * 2), 'quantity': 10})
+        took_profit = strategy.get_current_signal(
+            analyzed, {'entry_price': price / (1 + target * 2), 'quantity': 10})
+        
+        assert stopped['action'] == 'sell' and 'Stop loss' in stopped['reason']
+        assert took_profit['action'] == 'sell' and 'Take profit' in took_profit['reason']
+        assert stopped['price'] == price
+    
+    def test_get_strategy_cached(self):
+        """Test that repeated lookups share one strategy instance"""
+        assert get_strategy('aggressive') is get_strategy('aggressive')
+        assert get_strategy('aggressive') is not get_strategy('balanced')
+    
+    def test_get_strategy_unknown(self):
+        """Test that unknown strategy names are rejected"""
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            get_strategy('reckless')
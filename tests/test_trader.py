@@ -0,0 +1,75 @@
+"""
+Tests for trader module.
+"""
+import pytest
+from unittest.mock import patch, Mock
+from trader import Trader
+
+
+class TestTrader:
+    """Test the live trading loop with a mocked broker and data fetcher"""
+    
+    @pytest.fixture
+    def trader(self, sample_ohlcv_data):
+        """Trader whose broker and fetcher are mocks"""
+        with patch('trader.Broker'), patch('trader.DataFetcher'):
+            trader = Trader('aapl')
+        
+        trader.data_fetcher.fetch_data.return_value = sample_ohlcv_data
+        trader.broker.is_market_open.return_value = True
+        trader.broker.get_account_info.return_value = {'buying_power': 100000.0}
+        trader.broker.get_positions.return_value = []
+        trader.broker.get_current_price.return_value = 150.0
+        return trader
+    
+    @pytest.fixture
+    def buy_signal(self):
+        """A buy signal at $100 with a $98 stop"""
+        return {
+            'signal': 'buy',
+            'signal_value': 1,
+            'price': 100.0,
+            'rsi': 35.0,
+            'stop_loss': 98.0,
+            'take_profit': 104.0
+        }
+    
+    def test_step_analyzes_market_once(self, trader):
+        """Test that one tick fetches data and computes the signal once"""
+        with patch.object(trader, 'analyze_current_market',
+                          wraps=trader.analyze_current_market) as analyze:
+            status = trader.step()
+        
+        assert analyze.call_count == 1
+        assert trader.data_fetcher.fetch_data.call_count == 1
+        assert status['current_signal']['broker_price'] == 150.0
+        assert status['symbol'] == 'AAPL'
+        assert status['result']['action'] in ('hold', 'buy_signal', 'sell_signal')
+    
+    def test_step_market_closed(self, trader):
+        """Test that nothing is traded while the market is closed"""
+        trader.broker.is_market_open.return_value = False
+        
+        with patch.object(trader, '_execute_signal') as execute:
+            status = trader.step(dry_run=False)
+        
+        assert status['market_open'] is False
+        assert status['result']['action'] == 'market_closed'
+        execute.assert_not_called()
+        trader.broker.place_order.assert_not_called()
+        trader.broker.close_position.assert_not_called()
+    
+    def test_step_reuses_account_info_for_sizing(self, trader, buy_signal):
+        """Test that the account info fetched for the status also sizes the order"""
+        trader.strategy.get_current_signal = Mock(return_value=buy_signal)
+        config = trader.config
+        expected = min(int(100000.0 * config.RISK_PER_TRADE / 2.0),
+                       int(config.MAX_POSITION_SIZE / 100.0))
+        
+        status = trader.step(dry_run=False)
+        
+        assert trader.broker.get_account_info.call_count == 1
+        assert status['result']['action'] == 'buy_executed'
+        trader.broker.place_order.assert_called_once_with(
+            symbol='AAPL', qty=expected, side='buy', order_type='market'
+        )